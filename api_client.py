@@ -78,9 +78,6 @@ def generate_drone_frequencies(notes_data=None, sound_files=None):
         notes_data (dict, optional): Notes data for each voice (e.g., {'soprano': 'C#4'})
         sound_files (dict, optional): Sound file metadata to derive duration
     """
-    import random
-    from datetime import datetime
-
     # Debugging: Print received parameters
     print("Generating drone frequencies:")
     print("Notes data:", notes_data)
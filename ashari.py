@@ -1,3 +1,4 @@
+import heapq
 import json
 import re
 import random
@@ -7,6 +8,12 @@ import os
 import logging
 from sentiment import estimate_sentiment_with_ollama
 
+# orjson is optional - save_state rewrites the whole interaction history, which it encodes much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class Ashari:
 
     def __init__(self, memory_file="ashari_memory.json"):
@@ -70,8 +77,12 @@ class Ashari:
             "memory": self.memory
         }
         try:
-            with open(self.memory_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                with open(self.memory_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.memory_file, 'w') as f:
+                    json.dump(data, f, indent=2)
             print(f"✅ Ashari memory saved to {self.memory_file}")
         except Exception as e:
             print(f"⚠️ Error saving Ashari memory: {e}")
@@ -266,9 +277,8 @@ class Ashari:
             }
         else:
             # Create a response framework based on the identified themes
-            primary_themes = sorted(filtered_themes.items(), 
-                                    key=lambda x: abs(x[1]["bias"]), 
-                                    reverse=True)[:3]
+            primary_themes = heapq.nlargest(3, filtered_themes.items(), 
+                                            key=lambda x: abs(x[1]["bias"]))
             
             framework = {
                 "original_prompt": original_prompt,
@@ -287,6 +297,11 @@ class Ashari:
         
         return framework
     
+    def get_strongest_values(self, n=3):
+        """Get the n cultural values furthest from neutral as (value, score) pairs, strongest first"""
+        # nlargest is a single pass over the values instead of a full sort
+        return heapq.nlargest(n, self.cultural_memory.items(), key=lambda x: abs(x[1]))
+    
     def _calculate_overall_cultural_stance(self):
         """Calculate the overall cultural stance based on core values"""
         # Weighted average of core values
@@ -610,11 +625,7 @@ class Ashari:
         ashari_stance = self._calculate_overall_cultural_stance()
         
         # Get strongest values
-        strongest_values = sorted(
-            self.cultural_memory.items(), 
-            key=lambda x: abs(x[1]), 
-            reverse=True
-        )[:3]
+        strongest_values = self.get_strongest_values(3)
         
         # Check for historical significance
         is_historical = word in self.memory and self.memory[word].get("occurrences", 0) > 2
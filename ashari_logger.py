@@ -1,4 +1,7 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 def setup_ashari_logger():
     logger = logging.getLogger('ashari')
@@ -15,4 +18,34 @@ def setup_ashari_logger():
     return logger
 
 # Create a single instance to be imported elsewhere
-ashari_logger = setup_ashari_logger()
\ No newline at end of file
+ashari_logger = setup_ashari_logger()
+
+def setup_playback_logger():
+    """
+    Logger for the audio playback threads
+    
+    Records are handed to a queue and written by a listener thread, so a log call
+    on the playback thread never waits on console I/O. Routine per-sound and
+    per-check details are logged at DEBUG; set the level to DEBUG to see them.
+    """
+    logger = logging.getLogger('ashari.playback')
+    
+    # Only add handler if there isn't one already
+    if not logger.handlers:
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        log_queue = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, console_handler)
+        listener.start()
+        
+        # Flush anything still queued on exit
+        atexit.register(listener.stop)
+    
+    return logger
+
+playback_logger = setup_playback_logger()
@@ -0,0 +1,41 @@
+"""
+Shared pygame mixer setup.
+
+Opening the audio device is slow and keeps a mixer thread busy, so it is done
+on first use rather than when the managers are constructed.
+"""
+import threading
+import pygame
+
+# Mixer format used across the project
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+# 2048 samples (~46ms at 44.1kHz) is low enough latency for cues without underruns
+MIXER_BUFFER = 2048
+
+_mixer_lock = threading.Lock()
+
+# Make any pygame.init() or bare pygame.mixer.init() open the device with the project's format;
+# this only records the settings and doesn't open the device
+pygame.mixer.pre_init(frequency=MIXER_FREQUENCY, size=MIXER_SIZE, channels=MIXER_CHANNELS, buffer=MIXER_BUFFER)
+
+def ensure_mixer(num_channels=0, reserved=0):
+    """
+    Initialize the pygame mixer if needed and make sure it has enough channels
+
+    Channel counts are only ever raised, since other components may already rely on more.
+
+    :param num_channels: Minimum number of mixer channels
+    :param reserved: Minimum number of low channels to keep out of find_channel's pool
+    """
+    with _mixer_lock:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=MIXER_FREQUENCY, size=MIXER_SIZE, channels=MIXER_CHANNELS, buffer=MIXER_BUFFER)
+
+        if num_channels and pygame.mixer.get_num_channels() < num_channels:
+            pygame.mixer.set_num_channels(num_channels)
+
+        if reserved:
+            # set_reserved returns how many channels are now reserved
+            pygame.mixer.set_reserved(reserved)
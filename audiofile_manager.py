@@ -1,9 +1,45 @@
 import os
-import json
-import time
 import pygame
 import logging
 import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from json_cache import load_json_cached
+from audio_mixer import ensure_mixer
+from ashari_logger import playback_logger
+
+# Decoded PCM kept in the sound cache before least recently used sounds are dropped
+SOUND_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Numbered cue files ("1-4.mp3") are named after their section
+_SECTION_BY_CUE_PREFIX = {
+    "1-": "Rising Action",
+    "2-": "Middle",
+    "3-": "Climactic",
+}
+
+def _default_sound_section(filename):
+    """
+    Guess a sound's section from its filename, for sounds missing from the metadata
+    
+    :param filename: Name of the sound file
+    :return: Section name
+    """
+    section = _SECTION_BY_CUE_PREFIX.get(filename[:2])
+    if section:
+        return section
+    elif filename.startswith("bridge"):
+        return "Bridge"
+    elif filename.startswith("falling"):
+        return "Falling Voices"
+    elif filename.startswith("end_"):
+        return "Falling Action"
+    elif filename == "end_transition.mp3":
+        return "End"
+    elif filename == "end_1.mp3":
+        return "Falling Action"
+    else:
+        return "Intro"
 
 class AudioFileManager:
     """
@@ -18,8 +54,11 @@ class AudioFileManager:
         :param base_sound_path: Base directory for sound files
         :param metadata_path: Path to the JSON file containing sound file metadata
         """
-        # Initialize sound cache
-        self._sound_cache = {}
+        # Initialize sound cache, least recently used first and capped by decoded PCM size
+        self._sound_cache = OrderedDict()
+        self._sound_cache_nbytes = {}
+        self._sound_cache_bytes = 0
+        self._sound_cache_max_bytes = SOUND_CACHE_MAX_BYTES
         
         # Base path for sound files
         self.base_sound_path = base_sound_path
@@ -27,17 +66,23 @@ class AudioFileManager:
         # Sound metadata
         self.sound_metadata = {}
         self._load_sound_metadata(metadata_path)
+        self._index_sound_metadata()
         
-        # Initialize pygame mixer if not already initialized
-        if not pygame.mixer.get_init():
-            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=4096)
+        # Resolved file paths by filename, indexed from one scan of the sound directory
+        self._path_by_filename = self._index_sound_paths()
         
         # Background loading queue and thread
-        self._load_sound_queue = []
+        self._load_sound_queue = deque()
+        self._load_sound_queued = set()  # Same filenames as the queue, for constant-time membership checks
         self._load_sound_lock = threading.Lock()
+        self._load_sound_ready = threading.Condition(self._load_sound_lock)
         self._load_sound_thread = None
         self._load_sound_stop_event = threading.Event()
         
+        # Worker pool for decoding sounds ahead of playback, with in-flight loads by filename
+        self._preload_executor = ThreadPoolExecutor(max_workers=8)
+        self._pending_loads = {}
+        
         # Start the background sound loading thread
         self._start_sound_loader_thread()
         
@@ -57,15 +102,53 @@ class AudioFileManager:
         for path in possible_paths:
             try:
                 if os.path.exists(path):
-                    with open(path, 'r', encoding='utf-8') as f:
-                        self.sound_metadata = json.load(f)
-                        print(f"✅ Loaded sound files metadata from {path}")
-                        return
+                    self.sound_metadata = load_json_cached(path)
+                    print(f"✅ Loaded sound files metadata from {path}")
+                    return
             except Exception as e:
                 print(f"❌ Error trying to load sound files from {path}: {e}")
         
         print("❌ ERROR: Could not find sound_files.json")
     
+    def _index_sound_metadata(self):
+        """Split out the per-file fields the audio paths read, so lookups don't go through each file's dict"""
+        self._section_by_name = {}
+        self._duration_by_name = {}
+        self._files_by_section = {}
+        for filename, metadata in self.sound_metadata.items():
+            section = metadata.get('section')
+            self._section_by_name[filename] = section
+            self._duration_by_name[filename] = metadata.get('duration_seconds', 30)
+            self._files_by_section.setdefault(section, []).append(filename)
+        
+        # Freeze the per-section lists so they can be handed out without copying
+        self._files_by_section = {section: tuple(files) for section, files in self._files_by_section.items()}
+    
+    def _index_sound_paths(self):
+        """
+        Walk base_sound_path once and map each sound filename to its path
+        
+        If a filename appears in several folders, the one in its metadata section wins.
+        
+        :return: Dictionary of filename to full path
+        """
+        index = {}
+        pending_dirs = [self.base_sound_path]
+        while pending_dirs:
+            directory = pending_dirs.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            pending_dirs.append(entry.path)
+                        elif entry.is_file():
+                            section = self._section_by_name.get(entry.name)
+                            if entry.name not in index or os.path.basename(directory) == section:
+                                index[entry.name] = entry.path
+            except OSError:
+                continue
+        return index
+    
     def _start_sound_loader_thread(self):
         """Start the background sound loading thread"""
         if self._load_sound_thread and self._load_sound_thread.is_alive():
@@ -81,91 +164,123 @@ class AudioFileManager:
         """Background thread that loads sounds without blocking audio playback"""
         while not self._load_sound_stop_event.is_set():
             try:
-                # Get a sound filename to load, if any
-                filename = None
-                with self._load_sound_lock:
-                    if self._load_sound_queue:
-                        filename = self._load_sound_queue.pop(0)
-                
-                # If no sound to load, sleep and continue
-                if not filename:
-                    time.sleep(0.1)
-                    continue
+                # Sleep until a sound is queued or the loader is stopped
+                with self._load_sound_ready:
+                    while not self._load_sound_queue and not self._load_sound_stop_event.is_set():
+                        self._load_sound_ready.wait()
+                    if self._load_sound_stop_event.is_set():
+                        break
+                    filename = self._load_sound_queue.popleft()
+                    self._load_sound_queued.discard(filename)
                 
-                # Check if already in cache
-                with self._load_sound_lock:
-                    if filename in self._sound_cache:
-                        # Already loaded
-                        continue
-                
-                # Get path for the sound
-                path = self._get_sound_path(filename)
-                
-                # Load the sound if path exists
-                if path and os.path.exists(path):
-                    try:
-                        sound = pygame.mixer.Sound(path)
-                        with self._load_sound_lock:
-                            self._sound_cache[filename] = sound
-                    except Exception:
-                        # Silent error handling to avoid interrupting audio
-                        pass
+                # Load the sound into the cache
+                try:
+                    self._load_into_cache(filename)
+                except Exception:
+                    # Silent error handling to avoid interrupting audio
+                    pass
             
             except Exception:
                 # Silent error handling
-                time.sleep(0.2)
+                self._load_sound_stop_event.wait(0.2)
 
+    def _load_into_cache(self, filename):
+        """
+        Decode a sound file and store it in the cache
+        
+        :param filename: Name of the sound file
+        :return: True if the sound is cached, False if the file couldn't be found
+        """
+        # Check if already in cache
+        with self._load_sound_lock:
+            if filename in self._sound_cache:
+                return True
+        
+        # Get path for the sound
+        path = self._get_sound_path(filename)
+        if not path:
+            return False
+        
+        # Decode outside the lock so other loaders aren't blocked; decoding needs an open mixer
+        ensure_mixer()
+        sound = pygame.mixer.Sound(path)
+        with self._load_sound_lock:
+            self._cache_sound(filename, sound)
+        return True
+    
+    def _cache_sound(self, filename, sound):
+        """
+        Insert a sound into the cache, evicting least recently used ones while over the byte budget
+        
+        Must be called with _load_sound_lock held. The newest sound is always kept.
+        
+        :param filename: Name of the sound file
+        :param sound: pygame.mixer.Sound object
+        """
+        nbytes = self._sound_nbytes(sound)
+        self._sound_cache_bytes += nbytes - self._sound_cache_nbytes.get(filename, 0)
+        self._sound_cache_nbytes[filename] = nbytes
+        self._sound_cache[filename] = sound
+        self._sound_cache.move_to_end(filename)
+        while self._sound_cache_bytes > self._sound_cache_max_bytes and len(self._sound_cache) > 1:
+            evicted, _ = self._sound_cache.popitem(last=False)
+            self._sound_cache_bytes -= self._sound_cache_nbytes.pop(evicted, 0)
+    
+    @staticmethod
+    def _sound_nbytes(sound):
+        """
+        Estimate a decoded sound's PCM size from its length and the mixer format
+        
+        get_raw() would copy the whole buffer just to measure it.
+        
+        :param sound: pygame.mixer.Sound object
+        :return: Approximate size in bytes
+        """
+        try:
+            frequency, size, channels = pygame.mixer.get_init()
+            return int(sound.get_length() * frequency * channels * (abs(size) // 8))
+        except Exception:
+            return 0
     
     def stop_background_loader(self):
         """Stop the background sound loading thread"""
         if self._load_sound_thread and self._load_sound_thread.is_alive():
             self._load_sound_stop_event.set()
+            with self._load_sound_ready:
+                self._load_sound_ready.notify_all()
             self._load_sound_thread.join(timeout=1)
             print("Background sound loader stopped")
+        
+        # Drop any preloads that haven't started yet
+        self._preload_executor.shutdown(wait=False, cancel_futures=True)
     
     def preload_all_sounds(self):
         """Preload all sound files into the cache"""
         total_sounds = len(self.sound_metadata)
-        loaded_count = 0
-        failed_count = 0
         
-        # Track preloading progress
-        start_time = time.time()
+        # Critical sounds must be ready before we return
+        critical_sounds = ["intro.mp3", "end_transition.mp3", "end_1.mp3"]
+        filenames = list(self.sound_metadata.keys())
+        filenames.extend(s for s in critical_sounds if s not in self.sound_metadata)
         
-        for filename in self.sound_metadata.keys():
-            try:
-                # Add to the loading queue with highest priority
-                with self._load_sound_lock:
-                    if filename not in self._sound_cache and filename not in self._load_sound_queue:
-                        self._load_sound_queue.insert(0, filename)
-                        loaded_count += 1
-                
-            except Exception as e:
-                print(f"❌ Error queueing {filename}: {e}")
-                failed_count += 1
+        # Submit every uncached sound to the decode pool
+        futures = {}
+        for filename in filenames:
+            future = self.prefetch_sound(filename)
+            if future is not None:
+                futures[filename] = future
         
         # Report queuing results
-        print(f"✅ All sounds queued for loading ({loaded_count} sounds)")
-        
-        # Wait for some critical sounds to be fully loaded before returning
-        critical_sounds = ["intro.mp3", "end_transition.mp3", "end_1.mp3"]
+        print(f"✅ All sounds queued for loading ({len(futures)} sounds)")
         
         # Wait up to 5 seconds for critical sounds to load
-        wait_start = time.time()
-        while time.time() - wait_start < 5.0:
-            # Check if all critical sounds are loaded
-            with self._load_sound_lock:
-                missing = [s for s in critical_sounds if s not in self._sound_cache]
-                if not missing:
-                    break
-            
-            # Wait a bit before checking again
-            time.sleep(0.1)
+        critical_futures = [futures[s] for s in critical_sounds if s in futures]
+        wait(critical_futures, timeout=5.0)
         
         # Report loading status
         with self._load_sound_lock:
             current_loaded = len(self._sound_cache)
-            remaining = len(self._load_sound_queue)
+        remaining = sum(1 for future in futures.values() if not future.done())
         
         print(f"💿 Initial loading complete: {current_loaded} loaded, {remaining} queued")
         
@@ -176,6 +291,42 @@ class AudioFileManager:
             "queued": remaining
         }
     
+    def prefetch_sound(self, filename):
+        """
+        Start decoding a sound in the background so a later get_sound is a cache hit
+        
+        :param filename: Name of the sound file
+        :return: Future for the load, or None if the sound is already cached
+        """
+        if filename is None:
+            return None
+        
+        with self._load_sound_lock:
+            if filename in self._sound_cache:
+                return None
+            
+            # Reuse a load that's already in flight
+            future = self._pending_loads.get(filename)
+            if future is not None:
+                return future
+            future = self._preload_executor.submit(self._load_into_cache, filename)
+            self._pending_loads[filename] = future
+        
+        # Registered once per load, outside the lock since an already finished future runs it immediately
+        future.add_done_callback(lambda f: self._forget_pending_load(filename, f))
+        return future
+    
+    def _forget_pending_load(self, filename, future):
+        """
+        Drop a finished prefetch from the in-flight loads, unless a newer load has replaced it
+        
+        :param filename: Name of the sound file
+        :param future: The finished load's future
+        """
+        with self._load_sound_lock:
+            if self._pending_loads.get(filename) is future:
+                del self._pending_loads[filename]
+    
     def get_sound(self, filename):
         """
         Get a sound from the cache or load it if not cached
@@ -189,25 +340,40 @@ class AudioFileManager:
         # Check cache first - with proper locking
         with self._load_sound_lock:
             if filename in self._sound_cache:
+                self._sound_cache.move_to_end(filename)
                 return self._sound_cache[filename]
             
-            # If not in cache, add to the background loading queue
-            if filename not in self._load_sound_queue:
+            # If not in cache or already being prefetched, add to the background loading queue
+            if filename not in self._load_sound_queued and filename not in self._pending_loads:
                 self._load_sound_queue.append(filename)
+                self._load_sound_queued.add(filename)
+                self._load_sound_ready.notify()
         
         # Check cache again, maybe the background thread loaded it
         with self._load_sound_lock:
             if filename in self._sound_cache:
                 return self._sound_cache[filename]
         
+        # If a prefetch is already decoding this sound, wait for it rather than decoding twice
+        future = self._pending_loads.get(filename)
+        if future is not None:
+            try:
+                future.result()
+            except Exception:
+                pass
+            with self._load_sound_lock:
+                if filename in self._sound_cache:
+                    return self._sound_cache[filename]
+        
         # If we get here, the sound isn't loaded yet
         # Try to load it directly as a last resort
         path = self._get_sound_path(filename)
-        if path and os.path.exists(path):
+        if path:
             try:
+                ensure_mixer()
                 sound = pygame.mixer.Sound(path)
                 with self._load_sound_lock:
-                    self._sound_cache[filename] = sound
+                    self._cache_sound(filename, sound)
                 return sound
             except Exception:
                 pass
@@ -218,23 +384,33 @@ class AudioFileManager:
         """
         Get the file path for a sound file
         
+        :param filename: Name of the sound file
+        :return: Full path to the sound file or None if not found
+        """
+        if filename in self._path_by_filename:
+            return self._path_by_filename[filename]
+        
+        # Remember misses too, so a missing file isn't probed again on every request
+        path = self._resolve_sound_path(filename)
+        self._path_by_filename[filename] = path
+        return path
+    
+    def _resolve_sound_path(self, filename):
+        """
+        Probe the sound directories for a sound file
+        
         :param filename: Name of the sound file
         :return: Full path to the sound file or None if not found
         """
         # Determine section from metadata
-        section = None
-        if filename in self.sound_metadata:
-            section = self.sound_metadata[filename].get('section')
+        section = self._section_by_name.get(filename)
         
         # If section not found, use default mappings
         if not section:
-            if filename.startswith("1-"):
-                section = "Rising Action"
-            elif filename.startswith("2-"):
-                section = "Middle"
-            elif filename.startswith("3-"):
-                section = "Climactic"
-            elif filename.startswith("bridge"):
+            section = _SECTION_BY_CUE_PREFIX.get(filename[:2])
+        
+        if not section:
+            if filename.startswith("bridge"):
                 section = "Bridge"
             elif filename.startswith("falling"):
                 section = "Falling Voices"
@@ -249,7 +425,7 @@ class AudioFileManager:
         
         # Use a single, consistent path format
         path = os.path.join(self.base_sound_path, section, filename)
-        print(f"Soundfile path: {path}")
+        playback_logger.debug("Soundfile path: %s", path)
         # Check if file exists
         if os.path.exists(path):
             return path
@@ -286,28 +462,11 @@ class AudioFileManager:
         :return: Section name or None if not found
         """
         # Check metadata first
-        if filename in self.sound_metadata:
-            return self.sound_metadata[filename].get('section')
+        if filename in self._section_by_name:
+            return self._section_by_name[filename]
         
         # If not in metadata, use default mappings
-        if filename.startswith("1-"):
-            return "Rising Action"
-        elif filename.startswith("2-"):
-            return "Middle"
-        elif filename.startswith("3-"):
-            return "Climactic"
-        elif filename.startswith("bridge"):
-            return "Bridge"
-        elif filename.startswith("falling"):
-            return "Falling Voices"
-        elif filename.startswith("end_"):
-            return "Falling Action"
-        elif filename == "end_transition.mp3":
-            return "End"
-        elif filename == "end_1.mp3":
-            return "Falling Action"
-        else:
-            return "Intro"
+        return _default_sound_section(filename)
     
     def get_sound_duration(self, filename):
         """
@@ -316,9 +475,10 @@ class AudioFileManager:
         :param filename: Name of the sound file
         :return: Duration in seconds or default 30 seconds if not found
         """
-        # Check metadata first
-        if filename in self.sound_metadata:
-            return self.sound_metadata[filename].get('duration_seconds', 30)
+        # Metadata is the one source here, so the answer doesn't change with what's cached;
+        # the playback loop times sounds it's actually playing with their decoded length
+        if filename in self._duration_by_name:
+            return self._duration_by_name[filename]
         
         # If not in metadata, try to get from the sound object
         sound = self.get_sound(filename)
@@ -336,15 +496,14 @@ class AudioFileManager:
         Get all sound files in a specific section
         
         :param section: Section name
-        :return: List of sound filenames
+        :return: Tuple of sound filenames
         """
-        return [
-            filename for filename, metadata in self.sound_metadata.items()
-            if metadata.get('section') == section
-        ]
+        return self._files_by_section.get(section, ())
     
     def clear_cache(self):
         """Clear the sound cache to free memory"""
         with self._load_sound_lock:
             self._sound_cache.clear()
+            self._sound_cache_nbytes.clear()
+            self._sound_cache_bytes = 0
         print("🧹 Sound cache cleared")
\ No newline at end of file
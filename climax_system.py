@@ -5,6 +5,7 @@ import pygame
 import math
 import os  # For os.path.join
 import traceback  # For detailed error reporting
+from performance_clock import get_clock
 
 class ClimaxIntensitySystem:
     """
@@ -14,12 +15,18 @@ class ClimaxIntensitySystem:
     def __init__(self, score_manager):
         # Store reference to score manager
         self.score_manager = score_manager
+        
+        # Shared performance clock
+        self._clock = get_clock()
 
         # Clips for different sections - PRESET these to ensure they're never empty
         self.rising_action_clips = [f"1-{i}.mp3" for i in range(8, 26)]  # 1-8.mp3 through 1-25.mp3
         self.falling_action_clips = [f"falling_{i}.mp3" for i in range(1, 4)]  # falling_1.mp3 through falling_4.mp3
         self.current_clips = self.rising_action_clips.copy()  # Default to rising action clips
         
+        # Falling Voices clips on disk, listed once so playing one doesn't stat the folder
+        self.falling_clip_paths = self._index_falling_clips()
+        
         print(f"Rising Action Clips: {self.rising_action_clips}")
         print(f"Falling Action Clips: {self.falling_action_clips}")
 
@@ -60,6 +67,15 @@ class ClimaxIntensitySystem:
         # Initialize the intensity periods from the performance model
         self._initialize_from_performance_model()
 
+    def _index_falling_clips(self):
+        """Map each falling_* clip in the Falling Voices folder to its path"""
+        folder_path = os.path.join("data", "sound_files", "Falling Voices")
+        try:
+            return {name: os.path.join(folder_path, name) for name in os.listdir(folder_path) if name.startswith("falling_")}
+        except OSError:
+            print(f"⚠️ Could not list Falling Action clips in: {folder_path}")
+            return {}
+
     def _initialize_from_performance_model(self):
         """Initialize timing from the performance model"""
         try:
@@ -96,8 +112,7 @@ class ClimaxIntensitySystem:
                       f"{self._format_time(section['midpoint_seconds'])} to {self._format_time(section['climax_seconds'])}")
 
             # Initialize with current section if available
-            from performance_clock import get_clock
-            current_time = get_clock().get_elapsed_seconds()
+            current_time = self._clock.get_elapsed_seconds()
             current_section = self.score_manager._get_current_section(current_time)
             
             if current_section:
@@ -147,9 +162,8 @@ class ClimaxIntensitySystem:
         print("")
         print("🚨 DIRECT TIME CHECK FOR INTENSITY PERIODS")
         
-        from performance_clock import get_clock
         try:
-            current_time = get_clock().get_elapsed_seconds()
+            current_time = self._clock.get_elapsed_seconds()
             print(f"⏱️ Current time: {self._format_time(current_time)}")
             
             # Check each intensity period
@@ -209,7 +223,6 @@ class ClimaxIntensitySystem:
 
     def _monitor_timeline(self):
         """Background thread that monitors timeline position and triggers intensity clips"""
-        from performance_clock import get_clock
         
         # For section checking
         last_section_check_time = 0
@@ -222,7 +235,7 @@ class ClimaxIntensitySystem:
         while not self.stop_event.is_set():
             try:
                 # Get current timeline position
-                current_time = get_clock().get_elapsed_seconds()
+                current_time = self._clock.get_elapsed_seconds()
                 
                 # Periodically check if the section has changed
                 if current_time - last_section_check_time >= section_check_interval:
@@ -310,12 +323,12 @@ class ClimaxIntensitySystem:
                     print(f"{section_emoji} Exiting intensity zone ({self._format_time(current_time)})")
 
                 # Sleep to avoid consuming too much CPU
-                time.sleep(0.1)  # More frequent checks for more accurate timing
+                self.stop_event.wait(0.1)  # More frequent checks for more accurate timing
 
             except Exception as e:
                 print(f"Error in climax intensity monitoring: {e}")
                 traceback.print_exc()
-                time.sleep(1.0)  # Sleep longer on error
+                self.stop_event.wait(1.0)  # Sleep longer on error
 
     def _monitor_volume(self):
         """Background thread that manages volume tapering for clips"""
@@ -356,12 +369,12 @@ class ClimaxIntensitySystem:
                 self.active_count = active_count
 
                 # Sleep to avoid consuming too much CPU
-                time.sleep(0.05)  # More frequent updates for smoother fades
+                self.stop_event.wait(0.05)  # More frequent updates for smoother fades
 
             except Exception as e:
                 print(f"Error in volume monitoring: {e}")
                 traceback.print_exc()
-                time.sleep(0.5)  # Sleep longer on error
+                self.stop_event.wait(0.5)  # Sleep longer on error
 
     def _calculate_tapered_volume(self, elapsed, duration, base_volume):
         """Calculate volume with tapering at start and end"""
@@ -435,15 +448,12 @@ class ClimaxIntensitySystem:
             sound = None
             if self.current_section == "Falling Action" and clip.startswith("falling_"):
                 try:
-                    # Check if special folder exists
-                    folder_path = os.path.join("data", "sound_files", "Falling Voices")
-                    full_path = os.path.join(folder_path, clip)
+                    full_path = self.falling_clip_paths.get(clip)
                     
-                    if os.path.exists(full_path):
-                        print(f"✅ Found Falling Action clip at: {full_path}")
+                    if full_path:
                         sound = pygame.mixer.Sound(full_path)
                     else:
-                        print(f"⚠️ Could not find Falling Action clip at: {full_path}")
+                        print(f"⚠️ Could not find Falling Action clip: {clip}")
                         # Fall back to regular loading
                         sound = self.score_manager.audio_manager.get_sound(clip)
                 except Exception as e:
@@ -458,18 +468,8 @@ class ClimaxIntensitySystem:
                     print(f"⚠️ _load_sound returned None for clip: {clip}")
 
             if sound:
-                # Find a free channel
-                channel = pygame.mixer.find_channel()
-                if channel is None:
-                    print("⚠️ No available channel, trying to force-free one")
-                    # No channels available, try freeing one
-                    for i in range(pygame.mixer.get_num_channels()):
-                        ch = pygame.mixer.Channel(i)
-                        if ch.get_busy():
-                            print(f"  Stopping sound on channel {i} to make room")
-                            ch.stop()
-                            break
-                    channel = pygame.mixer.find_channel()
+                # Find a free channel, evicting the oldest sound if needed
+                channel = self.score_manager.sound_manager.claim_channel()
 
                 # Play the sound if we found a channel
                 if channel:
@@ -0,0 +1,91 @@
+"""
+Pickle cache for parsed JSON data files.
+
+Parsing the metadata JSON on every start is the bulk of startup I/O; a pickle
+written next to the JSON loads much faster and is reused until the JSON changes.
+"""
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import sys
+
+# orjson is optional - it parses large files several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bump to discard every existing pickle. The transform fingerprint already covers edits to the
+# transform's own module; bump this by hand when a transform depends on code in another module
+CACHE_VERSION = 1
+
+def _transform_fingerprint(transform):
+    """
+    Identify a transform by its code and its module's source, so editing either invalidates the cache
+
+    Hashing the whole module source also catches edits to helpers and constants the transform uses
+    from the same module, such as time_utils._convert_section_to_seconds.
+
+    :param transform: Function applied to the parsed data, or None
+    :return: Hashable fingerprint
+    """
+    if transform is None:
+        return None
+    code = getattr(transform, '__code__', None)
+    if code is None:
+        return getattr(transform, '__name__', repr(transform))
+    digest = hashlib.sha1(code.co_code)
+    digest.update(repr((code.co_consts, code.co_names)).encode('utf-8'))
+    module_file = getattr(sys.modules.get(transform.__module__), '__file__', None)
+    if module_file:
+        try:
+            with open(module_file, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+    return (transform.__module__, transform.__qualname__, digest.hexdigest())
+
+def load_json_cached(path, transform=None):
+    """
+    Load a JSON file, reusing a pickled copy while the file is unchanged
+
+    :param path: Path to the JSON file
+    :param transform: Optional function applied to the parsed data; its result is what gets cached
+    :return: Parsed (and transformed) data
+    """
+    stat = os.stat(path)
+    key = (CACHE_VERSION, stat.st_mtime, stat.st_size, _transform_fingerprint(transform))
+    cache_path = f"{path}.cache.pkl"
+
+    # Use the pickle if it was written from this exact version of the file and transform
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except Exception:
+        pass
+
+    if orjson is not None:
+        # Parse straight from a memory map rather than copying the file into a bytes object
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = orjson.loads(memoryview(mm))
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    if transform is not None:
+        data = transform(data)
+
+    # Write to a temp file first so another process never reads a partial pickle
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, data), f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only data directory - just skip the cache
+        pass
+
+    return data
@@ -12,6 +12,24 @@ from api_client import WebAppClient
 # Initialize the webapp client
 webapp_client = WebAppClient(base_url="http://localhost:3000")
 
+# System prompt for movement generation; it has no per-word parts, so it is built once
+MOVEMENT_SYSTEM_PROMPT = """
+            You are a movement choreographer for the Ashari culture, creating simple group and individual movement instructions.
+            
+            IMPORTANT: Create a continuous group movement that DIRECTLY expresses the meaning, imagery, or emotion of the ashari through a gallery space. 
+            The movement should be a physical embodiment or metaphor of this concept. Movement is in a gallery space for a large group of people.
+            
+            FORMAT REQUIREMENTS:
+            - Must specify at least one direction (up, down, forward, side, etc.)
+            - Use specific action verbs (extend, curl, step, reach, sway, turn, etc.)
+            - Find things to look at such as people or objects containing colors
+            - Use the art gallery space
+            - Must incorporate walking, bending, swaying, to move throughout the gallery space
+            - No metaphors or explanations, only direct physical instructions
+            
+            YOUR OUTPUT MUST BE EXACTLY ONE CONCRETE PHYSICAL INSTRUCTION.
+        """
+
 ashari = Ashari()
 
 def generate_movement_score(word):
@@ -31,11 +49,7 @@ def generate_movement_score(word):
         ashari_stance = ashari._calculate_overall_cultural_stance()
         
         # Identify the most extreme (positive or negative) cultural values
-        strongest_values = sorted(
-            ashari.cultural_memory.items(), 
-            key=lambda x: abs(x[1]), 
-            reverse=True
-        )[:3]  # Get top 3 strongest values
+        strongest_values = ashari.get_strongest_values(3)  # Get top 3 strongest values
         
         # Track if this word has historical significance (multiple occurrences)
         is_historical = word in ashari.memory and ashari.memory[word].get("occurrences", 0) > 2
@@ -107,24 +121,6 @@ def generate_movement_score(word):
         if is_historical:
             movement_type += " (drawing on collective memory)"
         
-        # Build the system prompt
-        system_prompt = f"""
-            You are a movement choreographer for the Ashari culture, creating simple group and individual movement instructions.
-            
-            IMPORTANT: Create a continuous group movement that DIRECTLY expresses the meaning, imagery, or emotion of the ashari through a gallery space. 
-            The movement should be a physical embodiment or metaphor of this concept. Movement is in a gallery space for a large group of people.
-            
-            FORMAT REQUIREMENTS:
-            - Must specify at least one direction (up, down, forward, side, etc.)
-            - Use specific action verbs (extend, curl, step, reach, sway, turn, etc.)
-            - Find things to look at such as people or objects containing colors
-            - Use the art gallery space
-            - Must incorporate walking, bending, swaying, to move throughout the gallery space
-            - No metaphors or explanations, only direct physical instructions
-            
-            YOUR OUTPUT MUST BE EXACTLY ONE CONCRETE PHYSICAL INSTRUCTION.
-        """
-
         user_prompt = f"""
             Create a single movement instruction for the word '{word}'.
             Word sentiment: {word_sentiment:.2f}
@@ -137,7 +133,7 @@ def generate_movement_score(word):
         response = ollama.chat(
             model="llama3.2",
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": MOVEMENT_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ]
         )
@@ -13,10 +13,11 @@ from ashari import Ashari
 from score import AshariScoreManager
 from sound_playback_manager import SoundPlaybackManager
 from performance_clock import get_clock, start_clock, get_time_str, stop_clock, set_elapsed_time
-from playsound import play_sound, play_input_sound, play_cultural_shift_sound
+from playsound import play_sound, play_input_sound, play_cultural_shift_sound, PLAYSOUND_CHANNELS
+from audio_mixer import ensure_mixer
 from section_midpoint_monitor import setup_section_midpoint_monitors
 
-# Initialize pygame (minimal initialization as playsound.py now handles the audio setup)
+# Initialize pygame (audio_mixer has already set the mixer format for it)
 pygame.init()
 print("Mycelial system initialized")
 
@@ -31,6 +32,9 @@ webapp_client = WebAppClient()
 score_manager = AshariScoreManager()
 sound_manager = SoundPlaybackManager()
 
+# Seconds the intro plays before the score manager's music starts
+INTRO_MUSIC_DELAY = 8
+
 with open('data/sound_files.json', 'r') as f:
     sound_files = json.load(f)
 
@@ -43,68 +47,6 @@ def clock_update(clock):
     if elapsed_seconds % 30 == 0:
         print(f"\n---\n🕒 Performance update - Time: {clock.get_time_str()} | Elapsed: {int(elapsed_seconds)} seconds\n---")
     
-def convert_model_to_seconds(model):
-    """
-    Convert a performance model with time strings to a seconds-based model.
-    
-    Ensures that all sections have *_seconds keys for start, end, midpoint, and climax.
-    
-    Args:
-        model (dict): Performance model potentially containing time strings
-    
-    Returns:
-        dict: Performance model with all times converted to seconds
-    """
-    # Create a deep copy to avoid modifying the original
-    import copy
-    converted_model = copy.deepcopy(model)
-    
-    # Convert total duration if it's a string
-    if isinstance(converted_model.get('total_duration'), str):
-        converted_model['total_duration_seconds'] = time_to_seconds(converted_model['total_duration'])
-    
-    # Default time mapping for sections if not specified
-    default_section_times = {
-        "Rising Action": {"start": 0, "end": 180, "midpoint": 60, "climax": 120},
-        "Bridge": {"start": 180, "end": 240},
-        "Falling Action": {"start": 240, "end": 360, "climax": 300}
-    }
-    
-    # Mapping of old keys to new keys
-    time_key_mapping = [
-        ('start_time', 'start_time_seconds'),
-        ('end_time', 'end_time_seconds'),
-        ('midpoint_time', 'midpoint_time_seconds'),
-        ('climax_time', 'climax_time_seconds')
-    ]
-    
-    # Convert section times
-    for section in converted_model.get('sections', []):
-        section_name = section.get('section_name', '')
-        default_times = default_section_times.get(section_name, {})
-        
-        for old_key, new_key in time_key_mapping:
-            # Try to convert from existing key
-            if old_key in section:
-                try:
-                    section[new_key] = time_to_seconds(section[old_key])
-                except Exception as e:
-                    print(f"Warning: Could not convert {old_key} for section {section_name}: {e}")
-                    # Use default if conversion fails
-                    section[new_key] = default_times.get(old_key.split('_')[0], 0)
-            
-            # If key doesn't exist, use default
-            if new_key not in section:
-                section[new_key] = default_times.get(new_key.split('_')[0], 0)
-        
-        # Ensure all time keys exist with sensible defaults
-        for key_base in ['start', 'end', 'midpoint', 'climax']:
-            seconds_key = f"{key_base}_time_seconds"
-            if seconds_key not in section:
-                section[seconds_key] = default_times.get(key_base, 0)
-    
-    return converted_model
-
     # Main game loop
 def text_input_game():
     # Initialize the global clock
@@ -156,7 +98,8 @@ def text_input_game():
         
         if user_input == "exit":
             print(f"Exiting game... 🌱")
-            pygame.mixer.stop()  # Stop all sounds before exiting
+            if pygame.mixer.get_init():
+                pygame.mixer.stop()  # Stop all sounds before exiting
             stop_clock()  # Stop the clock
             # Save Ashari's state before exiting
             ashari.save_state()
@@ -288,11 +231,7 @@ def text_input_game():
             # Get cultural context from Ashari
             cultural_context = {
                 "overall_sentiment": ashari._calculate_overall_cultural_stance(),
-                "key_values": [value for value, score in sorted(
-                    ashari.cultural_memory.items(), 
-                    key=lambda x: abs(x[1]), 
-                    reverse=True
-                )[:3]],
+                "key_values": [value for value, score in ashari.get_strongest_values(3)],
                 "current_time": get_time_str(),
                 "current_time_seconds": elapsed_seconds,
                 "current_section": current_section["section_name"] if current_section else None,
@@ -301,13 +240,12 @@ def text_input_game():
             
             play_input_sound()
             
-            # Queue sounds with enhanced context
-            score_manager.queue_sounds(keyword, cultural_context)
+            # Queue sounds with enhanced context without waiting on the GPT call
+            score_manager.submit_sound(keyword, cultural_context)
 
         elif method == "queue":
             # Print detailed information about the current playback queue
-            with score_manager._playback_lock:
-                queue = list(score_manager.playback_queue)
+            queue = score_manager.sound_manager.get_queue()
             
             print(f"\n🎶 Current Playback Queue:")
             if not queue:
@@ -339,6 +277,18 @@ def text_input_game():
         else:
             print(f"⚠️ Invalid method. Use 'haiku', 'move', or 'score'.")
 
+def start_score_after_delay(delay=INTRO_MUSIC_DELAY):
+    """
+    Start score_manager playback after a delay without blocking the caller
+    
+    :param delay: Seconds to wait before starting playback
+    :return: The started threading.Timer, which can be cancelled
+    """
+    timer = threading.Timer(delay, score_manager.start_playback)
+    timer.daemon = True
+    timer.start()
+    return timer
+
 def play_intro_with_music_delay():
     """
     Play the intro file on a reserved channel that won't be affected by score_manager.
@@ -352,16 +302,13 @@ def play_intro_with_music_delay():
     # Check if the file exists
     if not os.path.exists(intro_file):
         print(f"⚠️ Intro file not found: {intro_file}")
-        print("Starting score manager after 8 seconds...")
-        time.sleep(8)
-        score_manager.start_playback()
+        print(f"Starting score manager after {INTRO_MUSIC_DELAY} seconds...")
+        start_score_after_delay()
         return
     
     try:
-        # Make sure pygame.mixer is initialized (should already be from playsound.py)
-        if not pygame.mixer.get_init():
-            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=4096)
-            print("Initialized pygame mixer for intro playback")
+        # Make sure pygame.mixer is initialized with playsound's channels, so the last one is above the reserved ones
+        ensure_mixer(num_channels=PLAYSOUND_CHANNELS)
         
         # Use the VERY LAST channel available - assuming score_manager won't touch this
         # Most systems use channels counting from 0, so using the last one reduces conflicts
@@ -389,9 +336,9 @@ def play_intro_with_music_delay():
             expected_end_time = start_time + intro_duration
 
             try:
-                # Start the score manager after 8 seconds
-                print("Waiting 8 seconds before starting music...")
-                time.sleep(8)
+                # Start the score manager after the intro delay
+                print(f"Waiting {INTRO_MUSIC_DELAY} seconds before starting music...")
+                time.sleep(INTRO_MUSIC_DELAY)
                 
                 # Start the music
                 print("✅ Starting score manager playback")
@@ -413,7 +360,7 @@ def play_intro_with_music_delay():
             except Exception as e:
                 print(f"❌ Error in intro monitoring: {e}")
                 # Ensure score manager starts even if there's an error
-                if time.time() - start_time >= 8 and not score_manager.is_playing:
+                if time.time() - start_time >= INTRO_MUSIC_DELAY and not score_manager.is_playing:
                     print("Starting score manager despite error")
                     score_manager.start_playback()
         
@@ -426,10 +373,9 @@ def play_intro_with_music_delay():
         
     except Exception as e:
         print(f"❌ Error setting up intro playback: {e}")
-        # Fall back to starting score manager after 8 seconds
-        print("Starting score manager after 8 seconds despite error...")
-        time.sleep(8)
-        score_manager.start_playback()
+        # Fall back to starting score manager after the usual delay
+        print(f"Starting score manager after {INTRO_MUSIC_DELAY} seconds despite error...")
+        start_score_after_delay()
 
 # Run the game
 if __name__ == "__main__":
@@ -1,20 +1,23 @@
 import pygame
 import time
 import os
+import json
 import random 
 import threading
+from collections import OrderedDict, deque
+from audio_mixer import ensure_mixer
 
-# Reset and reinitialize pygame mixer to avoid conflicts
-if pygame.mixer.get_init():
-    pygame.mixer.quit()
+# Mixer channels play_sound makes sure exist; the mixer is opened on the first play_sound
+PLAYSOUND_CHANNELS = 64
 
-pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=4096)
-pygame.mixer.set_num_channels(64)  # Use 64 channels to ensure plenty are available
+# Cache for loaded sounds, least recently used first and capped since each holds decoded PCM
+sound_cache = OrderedDict()
+SOUND_CACHE_MAX = 32
+_sound_cache_lock = threading.Lock()
 
-print(f"Playsound module initialized with {pygame.mixer.get_num_channels()} audio channels")
-
-# Cache for loaded sounds
-sound_cache = {}
+# Channels started by play_sound, least recently started first, for evicting when the mixer is full
+_channel_lru = deque(maxlen=PLAYSOUND_CHANNELS)
+_channel_lru_lock = threading.Lock()
 
 # Module functions for compatibility with original code
 class playsound:
@@ -50,40 +53,42 @@ def play_sound(sound_file, block=False):
             print(f"⚠️ Sound file not found: {sound_file}")
             return False
         
+        # Open the shared mixer on first use instead of at import
+        ensure_mixer(num_channels=PLAYSOUND_CHANNELS)
+        
         # Load from cache or create new Sound object
-        if sound_file in sound_cache:
-            sound = sound_cache[sound_file]
-        else:
+        with _sound_cache_lock:
+            sound = sound_cache.get(sound_file)
+            if sound is not None:
+                sound_cache.move_to_end(sound_file)
+        if sound is None:
             sound = pygame.mixer.Sound(sound_file)
-            sound_cache[sound_file] = sound
+            with _sound_cache_lock:
+                sound_cache[sound_file] = sound
+                if len(sound_cache) > SOUND_CACHE_MAX:
+                    sound_cache.popitem(last=False)
         
-        # Find an available channel with retries
-        channel = None
-        retries = 0
-        while channel is None and retries < 5:
-            channel = pygame.mixer.find_channel()
-            if channel is None:
-                # If no channel is available, wait briefly and try again
-                retries += 1
-                print(f"⚠️ No available channel for playback, retrying ({retries}/5)...")
-                # Stop oldest playing sound if we've reached max retries
-                if retries >= 3:
-                    for ch_num in range(pygame.mixer.get_num_channels()):
-                        ch = pygame.mixer.Channel(ch_num)
-                        if ch.get_busy():
-                            print("⚠️ Stopping oldest sound to free a channel")
-                            ch.stop()
-                            break
-                time.sleep(0.2)
-                
-                # Increase channels if needed
-                if retries == 4 and pygame.mixer.get_num_channels() < 64:
-                    new_channels = pygame.mixer.get_num_channels() * 2
-                    print(f"⚠️ Increasing channels to {new_channels}")
-                    pygame.mixer.set_num_channels(new_channels)
+        # Find an available channel; the mixer already has PLAYSOUND_CHANNELS, so when none is free
+        # reuse the least recently started one instead of polling and resizing
+        channel = pygame.mixer.find_channel()
+        if channel is None:
+            victim = None
+            with _channel_lru_lock:
+                while _channel_lru:
+                    victim = _channel_lru.popleft()
+                    if victim.get_busy():
+                        break
+            if victim is not None:
+                print("⚠️ No available channel, stopping oldest sound to free a channel")
+                victim.stop()
+                channel = victim
+            # Otherwise nothing we started is playing; don't force a channel, since SDL's
+            # oldest-channel pick can cut off the playback loop's reserved or finale channels
         
         if channel:
             # Play the sound
+            with _channel_lru_lock:
+                _channel_lru.append(channel)
             channel.play(sound)
             print(f"🔊 Playing sound: {os.path.basename(sound_file)}")
             
@@ -95,7 +100,6 @@ def play_sound(sound_file, block=False):
                 print("Attempting to send drone data...")
 
                 # Import necessary modules
-                import json
                 from api_client import generate_drone_frequencies, WebAppClient
                 
                 # Load the sound metadata from the JSON file
@@ -148,13 +152,35 @@ def play_sound(sound_file, block=False):
             
             return True
         else:
-            print("❗ Failed to find available channel after multiple retries")
+            print("❗ Failed to find available channel")
             return False
             
     except Exception as e:
         print(f"❌ Error playing sound {sound_file}: {e}")
         return False
 
+# Bundled sound paths already found by _find_sound_file; misses aren't kept
+_found_sound_paths = {}
+
+def _find_sound_file(sound_path):
+    """
+    Find a bundled sound in the working directory, next to this module, or by bare filename
+    
+    Found paths are remembered, since the bundled sounds don't move while running. A missing
+    file is looked for again next time, in case it has been added since.
+    
+    :param sound_path: Path relative to the project root
+    :return: Path that exists, or None if not found
+    """
+    path = _found_sound_paths.get(sound_path)
+    if path is not None:
+        return path
+    for path in (sound_path, os.path.join(os.path.dirname(__file__), sound_path), os.path.basename(sound_path)):
+        if os.path.exists(path):
+            _found_sound_paths[sound_path] = path
+            return path
+    return None
+
 def play_in_thread(sound_file):
     """Play a sound in a separate thread"""
     threading.Thread(target=play_sound, args=(sound_file, True), daemon=True).start()
@@ -164,32 +190,18 @@ def play_input_sound():
     input_number = random.randint(1, 4)
     input_sound_path = f"data/sound_files/input_sound/input_{input_number}.mp3"
     
-    # Check in multiple locations
-    possible_paths = [
-        input_sound_path,
-        os.path.join(os.path.dirname(__file__), input_sound_path),
-        f"input_{input_number}.mp3"
-    ]
-    
-    for path in possible_paths:
-        if os.path.exists(path):
-            print(f"🔊 Selected input sound: input_{input_number}.mp3")
-            play_in_thread(path)
-            return True
+    path = _find_sound_file(input_sound_path)
+    if path:
+        print(f"🔊 Selected input sound: input_{input_number}.mp3")
+        play_in_thread(path)
+        return True
     
     # If the selected file wasn't found, try with input_2.mp3 as fallback
-    fallback_path = "data/sound_files/input_sound/input_2.mp3"
-    possible_fallback_paths = [
-        fallback_path,
-        os.path.join(os.path.dirname(__file__), fallback_path),
-        "input_2.mp3"
-    ]
-    
-    for path in possible_fallback_paths:
-        if os.path.exists(path):
-            print("⚠️ Using fallback input sound (input_2.mp3)")
-            play_in_thread(path)
-            return True
+    path = _find_sound_file("data/sound_files/input_sound/input_2.mp3")
+    if path:
+        print("⚠️ Using fallback input sound (input_2.mp3)")
+        play_in_thread(path)
+        return True
     
     print("❌ Input sound files not found in any expected location")
     return False
@@ -198,17 +210,10 @@ def play_cultural_shift_sound(magnitude):
     """Play a sound based on the magnitude of cultural shift"""
     shift_sound = "data/sound_files/cultural_shift/shift.mp3"
     
-    # Check in multiple locations
-    possible_paths = [
-        shift_sound,
-        os.path.join(os.path.dirname(__file__), shift_sound),
-        os.path.basename(shift_sound)
-    ]
-    
-    for path in possible_paths:
-        if os.path.exists(path):
-            play_in_thread(path)
-            return True
+    path = _find_sound_file(shift_sound)
+    if path:
+        play_in_thread(path)
+        return True
     
     print(f"⚠️ Cultural shift sound file not found: {shift_sound}")
     return False
\ No newline at end of file
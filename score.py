@@ -1,25 +1,216 @@
+import asyncio
+import bisect
+import hashlib
+import heapq
 import json
+import math
+import operator
 import os
+import queue
+import random
+import re
 import threading
 import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 import config
 import pygame
 import logging
 from performance_clock import get_clock, get_time_str
 from time_utils import convert_model_to_seconds, _format_time
+from json_cache import load_json_cached
+from ashari_logger import playback_logger
 from audiofile_manager import AudioFileManager
 from sound_playback_manager import SoundPlaybackManager
 
+# orjson is optional - it's much faster for prompt and log serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numpy is optional - it scores the whole dialogue catalog against a keyword in one matrix product
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Embedding model used to shortlist the sounds whose dialogue is closest to a keyword
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Candidates shown to GPT after the embedding shortlist
+EMBEDDING_SHORTLIST_SIZE = 12
+WORD_EMBEDDING_CACHE_SIZE = 256
+# Seconds a keyword embedding may take before the selection goes ahead with the full catalog
+EMBEDDING_TIMEOUT = 2.0
+# Seconds to wait before embedding the dialogue catalog again after a failure
+EMBEDDING_RETRY_INTERVAL = 60.0
+
+# Catalogs with queued sounds left out, cached by (section, excluded sounds)
+FILTERED_CATALOG_CACHE_SIZE = 64
+
+# GPT selections reused for the same keyword in the same performance context
+SELECTION_CACHE_SIZE = 512
+
+# Worker threads running submit_sound's GPT selections off the caller's thread; keywords
+# arriving while all of them are busy are selected together in one batched GPT request
+GPT_WORKERS = 4
+
+# queue_sounds skips selection once this many sounds are waiting to play
+MAX_QUEUE_SIZE = 16
+
+# The section monitor sleeps until the next boundary, but rechecks at least this often
+# (seconds) in case the performance clock is paused or set to a new time
+SECTION_RECHECK_INTERVAL = 1.0
+# Seconds past a boundary to wake, so the lookup lands in the new section
+SECTION_BOUNDARY_MARGIN = 0.01
+
+# Longest dialogue excerpt sent to GPT for each sound
+DIALOGUE_SUMMARY_LENGTH = 120
+
+# Log directories already created by this process
+_ensured_dirs = set()
+
+def _compact_json(obj):
+    """Serialize obj as compact JSON text, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=str)
+
+def _parse_sid_list(text):
+    """
+    Read the sids out of a batched selection reply, tolerating code fences and extra text
+    
+    :param text: GPT reply, ideally a JSON array of sids
+    :return: List of sid strings, in order
+    """
+    match = re.search(r"\[.*\]", text, re.DOTALL)
+    if match:
+        try:
+            sids = json.loads(match.group(0))
+            if isinstance(sids, list):
+                return [str(sid).strip() for sid in sids]
+        except ValueError:
+            pass
+    return re.findall(r"\bs\d{4}\b", text)
+
+def _summarize_dialogue(dialogue):
+    """Collapse whitespace and keep the first sentence of a dialogue, capped at DIALOGUE_SUMMARY_LENGTH"""
+    text = " ".join(str(dialogue or '').split())
+    for i, char in enumerate(text[:DIALOGUE_SUMMARY_LENGTH]):
+        if char in ".!?" and (i + 1 == len(text) or text[i + 1] == " "):
+            return text[:i + 1]
+    return text[:DIALOGUE_SUMMARY_LENGTH]
+
 class AshariScoreManager:
+    # System prompts are static, so build them once rather than on every GPT call
+    SYSTEM_PROMPT = """
+            You are the Sound Selector for the Ashari cultural narrative. Your task is to choose the most thematically and emotionally appropriate sound file based on the given keyword and cultural context, specifically from the available sound files within the current section of the performance.
+
+            REQUIREMENTS:
+            1. ALWAYS return a VALID SID from the available sound files within the **current section**.
+            2. Use the **dialogue section** as the primary method of selection.
+            3. Consider both the **current cultural memory** and the **performance timeline position**.
+            4. Match the sound file's dialogue to the input word's emotional and cultural resonance.
+            5. Select sounds that align with the **current section** of the performance (e.g., intro, middle, climactic).
+            6. DO NOT select any sound that is already in the **current playback queue**.
+
+            Selection Criteria:
+            - IMPORTANT: **Select only from the available sound files** in the **current section** of the performance.
+            - Avoid selecting any sound file that is **already in the current playback queue**.
+            - If a specific sound section is provided (e.g., **intro**, **middle**, **climactic**), **prefer sounds from that section**.
+            - Analyze how each sound file's dialogue connects to:
+              a) The input keyword
+              b) The current cultural sentiment
+              c) The strongest cultural values
+              d) The current performance theme
+            - Prioritize dialogues that:
+              - Reflect the **emotional nuance** of the keyword.
+              - Align with the **Ashari's current cultural stance**.
+              - Match the **current performance section's thematic elements**.
+              - Provide **depth and context** to the cultural experience.
+
+            Evaluation Process:
+            1. Read each dialogue carefully.
+            2. Compare the dialogue's themes to the keyword and cultural context.
+            3. Consider the **sentiment value** as a secondary factor.
+            4. Select the file that most profoundly captures the moment's **emotional** and **cultural significance** within the **current performance section**.
+
+            OUTPUT FORMAT:
+            - Respond ONLY with the **EXACT sid** (e.g. s0007) of the chosen sound file.
+            - **NO additional explanation or text**.
+            - If no perfect match exists, choose the closest thematic representation.
+
+            """
+    SYSTEM_PROMPT_HASH = hashlib.sha1(SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:12]
+
+    # Static part of the sound selection user prompt, filled in with str.format per call
+    USER_PROMPT_TEMPLATE = """
+            Select a sound file for the keyword: '{word}'
+
+            CULTURAL CONTEXT:
+            - Overall Sentiment: {overall_sentiment}
+            - Key Cultural Values: {key_values}
+
+            PERFORMANCE CONTEXT:
+            - Current Time: {performance_time}
+            - Current Section: {current_section}
+            - Section Progress: {section_progress}
+            - Current Theme: {current_theme}
+            - Preferred Sound Section: {mapped_sound_section}
+
+            CURRENT PLAYBACK QUEUE (sids):
+            {queue}
+            IMPORTANT: Do NOT select any sound file that is already in this queue.
+
+            AVAILABLE SOUND FILES (sid | sentiment | dialogue):
+{catalog}
+
+            ADDITIONAL GUIDANCE:
+            - DO NOT select any sound that is already in the current playback queue
+            - Deeply consider how the dialogues resonate with the Ashari's current cultural state
+            - The chosen sound should align with the current performance section theme
+            - The sound should feel like a profound cultural reflection appropriate for this moment
+            """
+
+    # Appended to the user prompt when several keywords are selected in one request
+    BATCH_PROMPT_SUFFIX = """
+            BATCH REQUEST:
+            - Select one DIFFERENT sound for each of these keywords, in order: {words}
+            - Respond ONLY with a JSON array of {count} sids, e.g. ["s0003", "s0011"]
+            """
+
+    END_CLIP_SYSTEM_PROMPT = """
+            You are the Conclusion Selector for the Ashari cultural narrative. Your task is to select the most appropriate ending clip that resonates with the Ashari's cultural journey.
+
+            REQUIREMENTS:
+            1. ALWAYS return a VALID FILENAME from the available **ending clips** in the **End section**.
+            2. Select a clip that reflects the **overall sentiment** and **cultural values** that have been dominant throughout the journey.
+            3. The ending should feel like a **natural conclusion** to the Ashari's story.
+            4. Consider the description of each clip and how it matches the **emotional tone** of the journey.
+
+            Selection Criteria:
+            - Match the clip's atmosphere with the **overall sentiment** of the Ashari's cultural development.
+            - Consider how the **ending clip's description** resonates with the strongest cultural values.
+            - Select an ending that provides **emotional closure** to the narrative journey.
+            - Choose an ending that feels **authentic** to the Ashari's experience.
+
+            OUTPUT FORMAT:
+            - Respond ONLY with the **EXACT filename** of the chosen ending clip.
+            - **NO additional explanation or text**.
+        """
+    END_CLIP_SYSTEM_PROMPT_HASH = hashlib.sha1(END_CLIP_SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:12]
+
     def __init__(self, 
                  ashari=None,
                  repeat=False,
                  sound_files_path='data/sound_files.json', 
                  performance_model_path='data/performance_model.json',
                  base_sound_path='data/sound_files',
-                 log_dir='logs'):
+                 log_dir='logs',
+                 preload_sounds=True):
         """
         Initialize the Ashari Score Manager
         
@@ -29,6 +220,7 @@ class AshariScoreManager:
         :param performance_model_path: Path to the JSON file containing performance timeline
         :param base_sound_path: Base directory for sound files
         :param log_dir: Directory to store GPT interaction logs
+        :param preload_sounds: Whether to start decoding every sound at startup
         """
 
         logging.basicConfig(
@@ -47,13 +239,30 @@ class AshariScoreManager:
         
         # Store the Ashari instance
         self.ashari = ashari
+        
+        # Shared performance clock
+        self._clock = get_clock()
 
         # Initialize OpenAI client
         self.client = OpenAI(api_key=config.CHAT_API_KEY)
         
+        # Sound selections share one async client, run on a single event loop thread so
+        # concurrent selections overlap their round trips over the same connection pool
+        self.aclient = AsyncOpenAI(api_key=config.CHAT_API_KEY)
+        self._gpt_loop = asyncio.new_event_loop()
+        self._gpt_loop_thread = threading.Thread(target=self._gpt_loop.run_forever, daemon=True, name="gpt-loop")
+        self._gpt_loop_thread.start()
+        
         # Ensure log directory exists
         self.log_dir = log_dir
-        os.makedirs(self.log_dir, exist_ok=True)
+        if log_dir not in _ensured_dirs:
+            os.makedirs(log_dir, exist_ok=True)
+            _ensured_dirs.add(log_dir)
+        
+        # GPT interaction logs are written by a background thread
+        self._log_queue = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_writer, daemon=True)
+        self._log_thread.start()
         
         # Load performance model
         self.performance_model = {}
@@ -68,8 +277,37 @@ class AshariScoreManager:
         # Get sound metadata from audio manager
         self.sound_files = self.audio_manager.sound_metadata
         
-        # Start preloading sounds in background
-        self.audio_manager.preload_all_sounds()
+        # Serialize the sound catalog once for GPT prompts
+        self._build_sound_catalog()
+        
+        # Dialogue embeddings are computed on a background thread; keyword embeddings are LRU cached
+        self._dialogue_embeddings = None
+        self._dialogue_embeddings_lock = threading.Lock()
+        self._dialogue_embeddings_thread = None
+        self._dialogue_embeddings_retry_at = 0.0
+        self._word_embedding_cache = OrderedDict()
+        
+        # GPT selections by (keyword, section, theme, sentiment), LRU
+        self._selection_cache = OrderedDict()
+        
+        # Guards the LRU caches above and the filtered catalog cache, which GPT worker threads share
+        self._cache_lock = threading.Lock()
+        
+        # Start embedding the dialogue catalog so the first selections don't wait for it
+        self._start_dialogue_embedding()
+        
+        # Runs queue_sounds for submit_sound so callers don't block on the GPT round trip
+        self._gpt_executor = ThreadPoolExecutor(max_workers=GPT_WORKERS, thread_name_prefix="gpt-select")
+        
+        # Keywords waiting for a worker, as (word, cultural_context, future), and workers draining them
+        self._pending_words = []
+        self._pending_words_lock = threading.Lock()
+        self._pending_drains = 0
+        self._max_queue_size = MAX_QUEUE_SIZE
+        
+        # Start preloading sounds in background so playback never waits on a decode
+        if preload_sounds:
+            self.audio_manager.preload_all_sounds()
         
         # Create sound playback manager
         self.sound_manager = SoundPlaybackManager(audio_manager=self.audio_manager)
@@ -80,9 +318,8 @@ class AshariScoreManager:
         self._end_transition_played = False
         self._performance_ended = False
         
-        # Cached section info
+        # Section found by the last current-time lookup
         self._current_section = None
-        self._last_section_check_time = 0
         
         # Section transition monitoring thread
         self._section_monitor_thread = None
@@ -111,18 +348,233 @@ class AshariScoreManager:
     def _load_performance_model(self, performance_model_path):
         """Load performance model from JSON"""
         try:
-            with open(performance_model_path, 'r', encoding='utf-8') as f:
-                original_model = json.load(f)
-            
-            # Convert the model to use seconds consistently
-            self.performance_model = convert_model_to_seconds(original_model)
+            # Convert the model to use seconds consistently (cached along with the parse)
+            self.performance_model = load_json_cached(performance_model_path, transform=convert_model_to_seconds)
+            self._index_sections()
             
             print(f"✅ Loaded performance model from {performance_model_path}")
             return True
         except Exception as e:
             print(f"❌ Error loading performance model: {e}")
+            self._index_sections()
             return False
 
+    def _index_sections(self):
+        """Sort the performance sections by time and record their end times for bisect lookups"""
+        sections = (self.performance_model or {}).get("sections") or []
+        self._sections = sorted(sections, key=lambda section: section["start_time_seconds"])
+        self._section_starts = [section["start_time_seconds"] for section in self._sections]
+        self._section_ends = [section["end_time_seconds"] for section in self._sections]
+        self._theme_steps = {
+            section["section_name"]: self._build_theme_steps(section)
+            for section in self._sections
+            if "thematic_elements" in section
+        }
+
+    def _build_theme_steps(self, section):
+        """
+        Precompute where a section's theme changes so _get_current_theme can bisect
+        
+        Rising Action switches theme at its midpoint and climax times when it has them;
+        other sections switch at fixed progress fractions.
+        
+        :param section: Performance model section with thematic_elements
+        :return: Tuple of (uses_time, thresholds, themes) where themes has one more entry than thresholds
+        """
+        themes = section["thematic_elements"]
+        if section["section_name"] == "Rising Action" and "midpoint_time_seconds" in section and "climax_time_seconds" in section:
+            thresholds = [section["midpoint_time_seconds"], section["climax_time_seconds"]]
+            return True, thresholds, (themes.get("start"), themes.get("midpoint"), themes.get("climax"))
+        return False, [0.33, 0.66], (themes.get("start"), themes.get("midpoint"), themes.get("end", themes.get("climax")))
+
+    def _build_sound_catalog(self):
+        """
+        Assign each sound file a short id (sid) and pre-format its GPT prompt row
+        
+        GPT is shown and returns sids instead of filenames; rows carry the sentiment
+        and a one-sentence dialogue summary so the prompt stays small. sound_files is static after load.
+        """
+        self._sid_table = {}
+        self._sid_by_filename = {}
+        self._dialogue_summary = {}
+        self._sound_catalog_entries = {}
+        for i, (filename, metadata) in enumerate(self.sound_files.items()):
+            sid = f"s{i:04d}"
+            dialogue = _summarize_dialogue(metadata.get('dialogue', ''))
+            self._sid_table[sid] = filename
+            self._sid_by_filename[filename] = sid
+            self._dialogue_summary[filename] = dialogue
+            self._sound_catalog_entries[filename] = f"{sid} | {metadata.get('sentiment_value', 0)} | {dialogue}"
+        self._sound_filenames_set = frozenset(self.sound_files)
+        
+        # Group files by section and prebuild each section's catalog text and filename tuple (None = all sounds)
+        self._sound_files_by_section = {}
+        for filename, metadata in self.sound_files.items():
+            self._sound_files_by_section.setdefault(metadata.get('section'), {})[filename] = metadata
+        self._catalog_text_by_section = {
+            section: self._format_sound_catalog(files)
+            for section, files in self._sound_files_by_section.items()
+        }
+        self._catalog_text_by_section[None] = self._format_sound_catalog(self.sound_files)
+        self._sound_names_by_section = {
+            section: tuple(files)
+            for section, files in self._sound_files_by_section.items()
+        }
+        self._sound_names_by_section[None] = tuple(self.sound_files)
+        self._filtered_catalog_cache = OrderedDict()
+
+    def _format_sound_catalog(self, filenames):
+        """
+        Join the pre-formatted catalog rows for the given files
+        
+        :param filenames: Iterable of sound filenames to include
+        :return: One "sid | sentiment | dialogue" row per line
+        """
+        return "\n".join(self._sound_catalog_entries[filename] for filename in filenames)
+
+    def _catalog_without(self, section, excluded):
+        """
+        Get a section's sounds and catalog text with some sounds left out, LRU cached
+        
+        :param section: Section name, or None for all sounds
+        :param excluded: frozenset of filenames to leave out
+        :return: Tuple of (sound files dict, catalog text, filename tuple)
+        """
+        key = (section, excluded)
+        with self._cache_lock:
+            cached = self._filtered_catalog_cache.get(key)
+            if cached is not None:
+                self._filtered_catalog_cache.move_to_end(key)
+                return cached
+        
+        source = self._sound_files_by_section[section] if section is not None else self.sound_files
+        files = {
+            filename: metadata
+            for filename, metadata in source.items()
+            if filename not in excluded
+        }
+        cached = (files, self._format_sound_catalog(files), tuple(files))
+        with self._cache_lock:
+            self._filtered_catalog_cache[key] = cached
+            if len(self._filtered_catalog_cache) > FILTERED_CATALOG_CACHE_SIZE:
+                self._filtered_catalog_cache.popitem(last=False)
+        return cached
+
+    def _embed_texts(self, texts, timeout=None):
+        """
+        Embed texts with the OpenAI embeddings API
+        
+        :param texts: List of strings to embed
+        :param timeout: Request timeout in seconds, or None for the client default
+        :return: Unit-length embedding vectors, one row per text (a numpy array when numpy is installed)
+        """
+        if timeout is None:
+            response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=texts)
+        else:
+            response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=texts, timeout=timeout)
+        if numpy is not None:
+            vectors = numpy.array([item.embedding for item in response.data], dtype=numpy.float32)
+            norms = numpy.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            return vectors / norms
+        vectors = []
+        for item in response.data:
+            norm = math.sqrt(sum(x * x for x in item.embedding)) or 1.0
+            vectors.append(tuple(x / norm for x in item.embedding))
+        return vectors
+
+    def _start_dialogue_embedding(self):
+        """Embed the dialogue catalog on a background thread, unless it's done, running or backing off"""
+        with self._dialogue_embeddings_lock:
+            if self._dialogue_embeddings is not None or time.monotonic() < self._dialogue_embeddings_retry_at:
+                return
+            if self._dialogue_embeddings_thread and self._dialogue_embeddings_thread.is_alive():
+                return
+            self._dialogue_embeddings_thread = threading.Thread(target=self._embed_dialogue_catalog, daemon=True)
+            self._dialogue_embeddings_thread.start()
+
+    def _embed_dialogue_catalog(self):
+        """Embed every sound's dialogue, or back off for EMBEDDING_RETRY_INTERVAL if the request fails"""
+        filenames = list(self.sound_files.keys())
+        try:
+            vectors = self._embed_texts([
+                f"{self.sound_files[filename].get('dialogue', '')} {self.sound_files[filename].get('section', '')}"
+                for filename in filenames
+            ])
+        except Exception as e:
+            self._dialogue_embeddings_retry_at = time.monotonic() + EMBEDDING_RETRY_INTERVAL
+            print(f"❌ Error embedding sound dialogue, retrying in {EMBEDDING_RETRY_INTERVAL:.0f}s: {e}")
+            return
+        rows = {filename: row for row, filename in enumerate(filenames)}
+        self._dialogue_embeddings = (rows, vectors)
+        print(f"✅ Embedded dialogue for {len(filenames)} sound files")
+
+    def _get_dialogue_embeddings(self):
+        """
+        Get the dialogue embeddings without waiting for them
+        
+        :return: Tuple of (row by filename, embedding matrix), or None until the background embedding succeeds
+        """
+        if self._dialogue_embeddings is None:
+            self._start_dialogue_embedding()
+        return self._dialogue_embeddings
+
+    def _get_word_embedding(self, word):
+        """
+        Get the embedding for a keyword, using the LRU cache when possible
+        
+        :param word: Input keyword
+        :return: Unit-length embedding vector
+        """
+        key = word.lower()
+        with self._cache_lock:
+            vector = self._word_embedding_cache.get(key)
+            if vector is not None:
+                self._word_embedding_cache.move_to_end(key)
+                return vector
+        
+        vector = self._embed_texts([key], timeout=EMBEDDING_TIMEOUT)[0]
+        with self._cache_lock:
+            self._word_embedding_cache[key] = vector
+            if len(self._word_embedding_cache) > WORD_EMBEDDING_CACHE_SIZE:
+                self._word_embedding_cache.popitem(last=False)
+        return vector
+
+    def _shortlist_by_embedding(self, word, candidates):
+        """
+        Narrow the candidates to the sounds whose dialogue is most similar to the keyword
+        
+        :param word: Input keyword
+        :param candidates: Iterable of candidate sound filenames
+        :return: Up to EMBEDDING_SHORTLIST_SIZE filenames, best match first, or None to keep every candidate
+        """
+        if len(candidates) <= EMBEDDING_SHORTLIST_SIZE:
+            return None
+        
+        dialogue_embeddings = self._get_dialogue_embeddings()
+        if not dialogue_embeddings:
+            return None
+        
+        try:
+            query = self._get_word_embedding(word)
+        except Exception as e:
+            playback_logger.error("❌ Error embedding keyword '%s': %s", word, e)
+            return None
+        
+        rows, matrix = dialogue_embeddings
+        if numpy is not None:
+            catalog_scores = (matrix @ query).tolist()
+            scores = {filename: catalog_scores[rows[filename]] for filename in candidates if filename in rows}
+        else:
+            scores = {
+                filename: sum(map(operator.mul, matrix[rows[filename]], query))
+                for filename in candidates
+                if filename in rows
+            }
+        if not scores:
+            return None
+        return heapq.nlargest(EMBEDDING_SHORTLIST_SIZE, scores, key=scores.get)
+
     def _would_cross_section_boundary(self, sound_file, duration):
         """
         Check if repeating this sound would cross a section boundary
@@ -131,9 +583,13 @@ class AshariScoreManager:
         :param duration: Duration of the sound in seconds
         :return: True if playing this sound would cross a section boundary
         """
+        # The end transition is never treated as crossing a boundary, so skip the lookups
+        if sound_file == "end_transition.mp3":
+            playback_logger.debug("🏁 End transition is playing - ignoring section boundary checks")
+            return False
+        
         # Get current time from performance clock
-        from performance_clock import get_clock
-        current_time = get_clock().get_elapsed_seconds()
+        current_time = self._clock.get_elapsed_seconds()
         
         # Get the current section
         current_section = self._get_current_section(current_time)
@@ -141,24 +597,24 @@ class AshariScoreManager:
         # Calculate where we'll be after this sound plays again
         future_time = current_time + duration
         
-        # Get the section we'd be in at that future time
-        future_section = self._get_current_section(future_time)
-        
-        # Special case for end_transition.mp3 - never consider it a section boundary
-        if sound_file == "end_transition.mp3":
-            print(f"🏁 End transition is playing - ignoring section boundary checks")
-            return False
+        # Get the section we'd be in at that future time - the current one if the sound ends before it does
+        if current_section and future_time <= current_section["end_time_seconds"]:
+            future_section = current_section
+        else:
+            future_section = self._section_at(future_time)
         
         # Special check for transition to End section
         if future_section and future_section["section_name"] == "End" and current_section and current_section["section_name"] != "End":
-            print(f"🏁 End section boundary detected! Current={current_section['section_name']}, Future=End")
-            print(f"Current time: {int(current_time//60):02d}:{int(current_time%60):02d}, Future time: {int(future_time//60):02d}:{int(future_time%60):02d}")
+            playback_logger.info(f"🏁 End section boundary detected! Current={current_section['section_name']}, Future=End")
+            playback_logger.debug("Current time: %02d:%02d, Future time: %02d:%02d",
+                                  *divmod(int(current_time), 60), *divmod(int(future_time), 60))
             return True
         
         # Check if we'd cross a section boundary
         if current_section and future_section and current_section["section_name"] != future_section["section_name"]:
-            print(f"Section boundary detected: {current_section['section_name']} -> {future_section['section_name']}")
-            print(f"Current time: {int(current_time//60):02d}:{int(current_time%60):02d}, Future time: {int(future_time//60):02d}:{int(future_time%60):02d}")
+            playback_logger.info(f"Section boundary detected: {current_section['section_name']} -> {future_section['section_name']}")
+            playback_logger.debug("Current time: %02d:%02d, Future time: %02d:%02d",
+                                  *divmod(int(current_time), 60), *divmod(int(future_time), 60))
             return True
         
         # Also check if the sound file's section doesn't match the future section
@@ -167,7 +623,7 @@ class AshariScoreManager:
         if future_section:
             future_sound_section = future_section["section_name"]
             if sound_section and sound_section != future_sound_section:
-                print(f"Sound section mismatch: {sound_section} vs {future_sound_section}")
+                playback_logger.debug("Sound section mismatch: %s vs %s", sound_section, future_sound_section)
                 return True
         
         return False
@@ -180,26 +636,25 @@ class AshariScoreManager:
         :return: A new sound file appropriate for the next section
         """
         # Get current time from performance clock
-        from performance_clock import get_clock
-        current_time = get_clock().get_elapsed_seconds()
+        current_time = self._clock.get_elapsed_seconds()
         
         # Calculate where we'll be after this sound plays again
         duration = self.audio_manager.get_sound_duration(current_sound)
         future_time = current_time + duration
         
         # Get the section we'd be in at that future time
-        future_section = self._get_current_section(future_time)
+        future_section = self._section_at(future_time)
         
         if not future_section:
-            print("⚠️ Couldn't determine future section, using default sound")
-            return list(self.sound_files.keys())[0] if self.sound_files else current_sound  # Use first sound or current as fallback
+            playback_logger.warning("⚠️ Couldn't determine future section, using default sound")
+            return next(iter(self.sound_files)) if self.sound_files else current_sound  # Use first sound or current as fallback
         
         # Map the performance section to sound section
         target_section = future_section["section_name"]
         
         # Special handling for End section - use end_transition.mp3
         if target_section == "End":
-            print("🏁 Detected transition to End section - playing end_transition.mp3")
+            playback_logger.info("🏁 Detected transition to End section - playing end_transition.mp3")
             return "end_transition.mp3"
         
         # Special handling for Falling Action section - use falling voice clips if appropriate
@@ -208,23 +663,21 @@ class AshariScoreManager:
             falling_clips = self.audio_manager.get_all_sounds_by_section("Falling Voices")
             
             if falling_clips:
-                import random
                 falling_clip = random.choice(falling_clips)
-                print(f"🍂 Selected Falling Action clip: {falling_clip}")
+                playback_logger.info(f"🍂 Selected Falling Action clip: {falling_clip}")
                 return falling_clip
         
         # Find all sounds from the target section
         section_sounds = self.audio_manager.get_all_sounds_by_section(target_section)
         
         if not section_sounds:
-            print(f"⚠️ No sounds found for section {target_section}, using current sound as fallback")
+            playback_logger.warning(f"⚠️ No sounds found for section {target_section}, using current sound as fallback")
             return current_sound  # Use current sound as fallback instead of a random one
         
         # Select a random sound from the appropriate section
-        import random
         selected_sound = random.choice(section_sounds)
         
-        print(f"Selected sound {selected_sound} for next section {target_section}")
+        playback_logger.info(f"Selected sound {selected_sound} for next section {target_section}")
         return selected_sound
 
     def start_playback(self):
@@ -241,70 +694,85 @@ class AshariScoreManager:
         print("🎵 Score playback system started")
     
     def _get_current_section(self, current_time_seconds: float):
-        """Get the current section based on elapsed time"""
-        # Use cached value if checked recently (within 5 seconds)
-        if self._current_section and time.time() - self._last_section_check_time < 5:
-            return self._current_section
-        
-        # Check if performance_model has sections
-        if not self.performance_model or "sections" not in self.performance_model:
-            print("⚠️ No performance model sections available")
+        """Get the current section based on elapsed time, remembering it as the current section"""
+        # Most calls land in the section found last time, so check its interval before searching
+        section = self._current_section
+        if section and section["start_time_seconds"] < current_time_seconds <= section["end_time_seconds"]:
+            return section
+        
+        section = self._section_at(current_time_seconds)
+        if section is not None:
+            self._current_section = section
+        return section
+
+    def _section_at(self, time_seconds: float):
+        """
+        Look up the section playing at a performance time
+        
+        :param time_seconds: Performance time in seconds
+        :return: Section dict, or None if the time falls between sections
+        """
+        sections = self._sections
+        if not sections:
+            playback_logger.debug("⚠️ No performance model sections available")
             return None
         
-        # Find the section containing the current time
-        for section in self.performance_model["sections"]:
-            if (section["start_time_seconds"] <= current_time_seconds and
-                    section["end_time_seconds"] >= current_time_seconds):
-                self._current_section = section
-                self._last_section_check_time = time.time()
-                return section
+        # Binary search for the first section ending at or after the time
+        index = bisect.bisect_left(self._section_ends, time_seconds)
         
         # If we're past the end of the defined sections, return the last one
-        if current_time_seconds > self.performance_model["sections"][-1]["end_time_seconds"]:
-            self._current_section = self.performance_model["sections"][-1]
-            self._last_section_check_time = time.time()
-            return self._current_section
+        if index == len(sections):
+            return sections[-1]
         
-        # If we're before the first section, return the first one
-        if current_time_seconds < self.performance_model["sections"][0]["start_time_seconds"]:
-            self._current_section = self.performance_model["sections"][0]
-            self._last_section_check_time = time.time()
-            return self._current_section
+        # Found the section containing the time, or we're before the first one
+        section = sections[index]
+        if section["start_time_seconds"] <= time_seconds or index == 0:
+            return section
         
         # If we reach here, something unexpected happened
-        print(f"⚠️ Could not determine section for time {current_time_seconds}")
+        playback_logger.debug("⚠️ Could not determine section for time %s", time_seconds)
         return None
 
+    def _seconds_until_section_change(self, time_seconds: float):
+        """
+        Get how long the section monitor can sleep before the section may change
+        
+        :param time_seconds: Current performance time in seconds
+        :return: Seconds until just past the next section start or end, capped at SECTION_RECHECK_INTERVAL
+        """
+        next_change = float('inf')
+        
+        # A time equal to a section's end still belongs to it, so the change comes just after that end
+        index = bisect.bisect_left(self._section_ends, time_seconds)
+        if index < len(self._section_ends):
+            next_change = self._section_ends[index]
+        
+        # Starts matter when the time falls in a gap between sections
+        index = bisect.bisect_right(self._section_starts, time_seconds)
+        if index < len(self._section_starts):
+            next_change = min(next_change, self._section_starts[index])
+        
+        delay = next_change - time_seconds + SECTION_BOUNDARY_MARGIN
+        return min(max(delay, 0.0), SECTION_RECHECK_INTERVAL)
+
     def _get_current_theme(self, section, progress):
         """Get the appropriate theme based on section progress"""
         if not section or "thematic_elements" not in section:
             return None
             
-        themes = section["thematic_elements"]
+        steps = self._theme_steps.get(section["section_name"])
+        if steps is None:
+            steps = self._build_theme_steps(section)
+        uses_time, thresholds, themes = steps
         
-        # For Rising Action, consider midpoint and climax timing if available
-        if section["section_name"] == "Rising Action" and "midpoint_time_seconds" in section and "climax_time_seconds" in section:
+        # Rising Action thresholds are performance times, the rest are progress fractions
+        if uses_time:
             section_start = section["start_time_seconds"]
-            section_end = section["end_time_seconds"]
-            midpoint_time = section["midpoint_time_seconds"]
-            climax_time = section["climax_time_seconds"]
-            
-            current_time = section_start + (section_end - section_start) * progress
-            
-            if current_time < midpoint_time:
-                return themes.get("start")
-            elif current_time < climax_time:
-                return themes.get("midpoint")
-            else:
-                return themes.get("climax")
+            position = section_start + (section["end_time_seconds"] - section_start) * progress
         else:
-            # For other sections, use simple progress thresholds
-            if progress < 0.33:
-                return themes.get("start")
-            elif progress < 0.66:
-                return themes.get("midpoint")
-            else:
-                return themes.get("end", themes.get("climax"))
+            position = progress
+        
+        return themes[bisect.bisect_right(thresholds, position)]
     
     def _calculate_section_progress(self, current_time_seconds: float, section):
         """Calculate progress through the current section (0.0 to 1.0)"""
@@ -316,38 +784,27 @@ class AshariScoreManager:
             return 0.0
         
         progress = (current_time_seconds - section_start) / section_duration
-        return max(0.0, min(1.0, progress))  # Clamp between 0 and 1
+        # Clamp between 0 and 1 with comparisons rather than two builtin calls
+        return 0.0 if progress < 0.0 else 1.0 if progress > 1.0 else progress
     
     def _monitor_section_transitions(self):
         """Background thread that monitors section transitions"""
-        from performance_clock import get_clock
 
         # Track the last known section
         last_section_name = None
-        section_check_interval = 0.25  # Check every 1/4 second
-        last_check_time = 0
 
         # Keep track of transitions we've already handled
         handled_sections = set()
 
         while not self._stop_event.is_set():
             try:
-                current_time = time.time()
-                
-                # Only check periodically to avoid excessive CPU usage
-                if current_time - last_check_time < section_check_interval:
-                    time.sleep(0.05)
-                    continue
-                    
-                last_check_time = current_time
-                
                 # Get current performance time
-                performance_time = get_clock().get_elapsed_seconds()
+                performance_time = self._clock.get_elapsed_seconds()
                 
                 # Get current section
                 current_section = self._get_current_section(performance_time)
                 if not current_section:
-                    time.sleep(0.1)
+                    self._stop_event.wait(self._seconds_until_section_change(performance_time))
                     continue
                     
                 current_section_name = current_section["section_name"]
@@ -365,7 +822,6 @@ class AshariScoreManager:
                         
                         if section_clips:
                             # Choose one of the default clips for this section
-                            import random
                             default_clip = random.choice(section_clips)
                             
                             # Add it to the queue
@@ -428,31 +884,19 @@ class AshariScoreManager:
                         end_clip = self.select_end_clip_with_gpt(cultural_context)
                         
                         if end_clip:
-                            # Load the sound file directly with Pygame
+                            # Use the cached sound if it was preloaded, decoding it now otherwise
                             try:
-                                sound = pygame.mixer.Sound(self.audio_manager._get_sound_path(end_clip))
+                                sound = self.audio_manager.get_sound(end_clip)
+                                if sound is None:
+                                    raise FileNotFoundError(f"No sound file found for {end_clip}")
                                 
-                                # Find a free channel
-                                channel = pygame.mixer.find_channel()
-                                if channel is None:
-                                    print("⚠️ No available channel, trying to force-free one")
-                                    # No channels available, try freeing one
-                                    for i in range(pygame.mixer.get_num_channels()):
-                                        ch = pygame.mixer.Channel(i)
-                                        if ch.get_busy():
-                                            print(f"  Stopping sound on channel {i} to make room")
-                                            ch.stop()
-                                            break
-                                    channel = pygame.mixer.find_channel()
-
-                                # Play the sound if we found a channel
-                                if channel:
-                                    # Use a better volume
-                                    channel.set_volume(0.8)
-                                    channel.play(sound)
-                                    print(f"▶️ Playing Final Clip ONCE ONLY: {end_clip}")
-                                else:
-                                    print("❌ CRITICAL: Still no available channel after attempting to free one")
+                                # Play on the reserved finale channel, so nothing has to be searched for or stopped
+                                channel = self.sound_manager.get_finale_channel()
+                                
+                                # Use a better volume
+                                channel.set_volume(0.8)
+                                channel.play(sound)
+                                print(f"▶️ Playing Final Clip ONCE ONLY: {end_clip}")
                             except Exception as e:
                                 print(f"❌ CRITICAL: Could not load final clip: {end_clip}")
                                 print(f"Error details: {e}")
@@ -462,33 +906,249 @@ class AshariScoreManager:
                     # Update last known section
                     last_section_name = current_section_name
                 
-                # Sleep to avoid consuming too much CPU
-                time.sleep(0.1)
+                # Sleep until the section can next change rather than polling; handling may have taken a while, so reread the clock
+                self._stop_event.wait(self._seconds_until_section_change(self._clock.get_elapsed_seconds()))
         
             except Exception as e:
                 print(f"Error in section transition monitoring: {e}")
-                import traceback
                 traceback.print_exc()
-                time.sleep(1.0)  # Sleep longer on error
+                self._stop_event.wait(1.0)  # Sleep longer on error
 
-    def select_sound_with_gpt(self, word: str, cultural_context: dict = None) -> str:
+    def select_sound_with_gpt(self, word: str, cultural_context: dict = None, current_time_seconds: float = None, current_section: dict = None) -> str:
         """
         Select a sound using GPT, enhanced with performance timeline awareness and current queue awareness
         
+        Blocks the calling thread while aselect_sound_with_gpt runs on the GPT event loop.
+        
+        :param word: Input keyword
+        :param cultural_context: Context including performance time and cultural data
+        :param current_time_seconds: Performance time if the caller already read the clock
+        :param current_section: Section at current_time_seconds if the caller already looked it up
+        :return: Selected sound filename or None
+        """
+        return self._run_on_gpt_loop(
+            self.aselect_sound_with_gpt(word, cultural_context, current_time_seconds, current_section)
+        )
+
+    def _run_on_gpt_loop(self, coro):
+        """
+        Run a coroutine on the GPT event loop and wait for its result
+        
+        :param coro: Coroutine to run
+        :return: The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._gpt_loop).result()
+
+    async def aselect_sound_with_gpt(self, word: str, cultural_context: dict = None, current_time_seconds: float = None, current_section: dict = None) -> str:
+        """
+        Select a sound using GPT on the shared async client
+        
         :param word: Input keyword
         :param cultural_context: Context including performance time and cultural data
+        :param current_time_seconds: Performance time if the caller already read the clock
+        :param current_section: Section at current_time_seconds if the caller already looked it up
         :return: Selected sound filename or None
         """
+        # Gather performance context, the current queue and the candidate sounds
+        cultural_context, current_queue, filtered_sound_files, catalog_text, candidate_names = self._prepare_sound_selection(
+            cultural_context, current_time_seconds, current_section
+        )
+
+        # Reuse an earlier selection for this keyword and context and skip the GPT round trip
+        cache_key = self._selection_cache_key(word, cultural_context)
+        cached_sound = self._cached_selection(cache_key, current_queue, filtered_sound_files)
+        if cached_sound:
+            return cached_sound
+
+        # Show GPT only the sounds whose dialogue is closest to the keyword; the keyword
+        # embedding is a blocking call, so keep it off the event loop
+        shortlist = await asyncio.to_thread(self._shortlist_by_embedding, word, filtered_sound_files)
+        if shortlist:
+            catalog_text = self._format_sound_catalog(shortlist)
+
+        user_prompt = self._format_selection_prompt(word, cultural_context, current_queue, filtered_sound_files, catalog_text)
+        
+        # Prepare input data for logging
+        input_data = {
+            "word": word,
+            "system_prompt_hash": self.SYSTEM_PROMPT_HASH,
+            "user_prompt": user_prompt,
+            "cultural_context": cultural_context,
+            "current_queue": current_queue
+        }
+        
+        try:
+            # Call GPT to select the sound file
+            response = await self.aclient.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": self.SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=50  # We only want the sid
+            )
+            
+            # Extract the sid and resolve it to a filename (accept a bare filename too)
+            selected_sid = response.choices[0].message.content.strip()
+            selected_filename = self._sid_table.get(selected_sid, selected_sid)
+            
+            # Log the interaction
+            self._log_gpt_interaction(
+                interaction_type="sound_selection", 
+                input_data=input_data, 
+                response=selected_sid
+            )
+            
+            # Validate the filename
+            selected_sound = self._resolve_selected_sound(selected_filename, word, cultural_context, current_queue, candidate_names)
+            
+            # Only GPT's own valid, unqueued pick is worth reusing, not a random stand-in for it
+            if selected_sound == selected_filename and selected_filename in filtered_sound_files and selected_filename not in current_queue:
+                self._remember_selection(cache_key, selected_sound)
+            return selected_sound
+        
+        except Exception as e:
+            # Log any errors
+            self._log_gpt_interaction(
+                interaction_type="sound_selection_error", 
+                input_data=input_data, 
+                response=str(e)
+            )
+            playback_logger.error("Error in sound file selection: %s", e)
+            return None
+
+    def select_sounds_with_gpt(self, words: list, cultural_context: dict = None) -> list:
+        """
+        Select a sound for each of several keywords in one GPT request
+        
+        :param words: Input keywords
+        :param cultural_context: Context including performance time and cultural data
+        :return: Selected sound filename (or None) for each word, in order
+        """
+        return self._run_on_gpt_loop(self.aselect_sounds_with_gpt(words, cultural_context))
+
+    async def aselect_sounds_with_gpt(self, words: list, cultural_context: dict = None) -> list:
+        """
+        Select a sound for each of several keywords, sending the catalog to GPT only once
+        
+        Earlier picks count as queued, so a batch doesn't repeat a sound. Words GPT
+        gave no usable sid for are left as None for the caller to select on their own.
+        
+        :param words: Input keywords
+        :param cultural_context: Context including performance time and cultural data
+        :return: Selected sound filename (or None) for each word, in order
+        """
+        # Gather performance context, the current queue and the candidate sounds
+        cultural_context, current_queue, filtered_sound_files, catalog_text, candidate_names = self._prepare_sound_selection(cultural_context)
+        
+        # Reuse earlier selections and only ask GPT about the rest
+        cache_keys = [self._selection_cache_key(word, cultural_context) for word in words]
+        selections = [self._cached_selection(key, current_queue, filtered_sound_files) for key in cache_keys]
+        gpt_words = [word for word, selected in zip(words, selections) if not selected]
+        if not gpt_words:
+            return selections
+        
+        user_prompt = self._format_selection_prompt(", ".join(gpt_words), cultural_context, current_queue, filtered_sound_files, catalog_text)
+        user_prompt += self.BATCH_PROMPT_SUFFIX.format(words=_compact_json(gpt_words), count=len(gpt_words))
+        
+        # Prepare input data for logging
+        input_data = {
+            "words": gpt_words,
+            "system_prompt_hash": self.SYSTEM_PROMPT_HASH,
+            "user_prompt": user_prompt,
+            "cultural_context": cultural_context,
+            "current_queue": current_queue
+        }
+        
+        try:
+            # Call GPT to select all the sound files at once
+            response = await self.aclient.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": self.SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=10 * len(gpt_words) + 20  # We only want the sids
+            )
+            selected_text = response.choices[0].message.content.strip()
+            
+            # Log the interaction
+            self._log_gpt_interaction(
+                interaction_type="batch_sound_selection", 
+                input_data=input_data, 
+                response=selected_text
+            )
+        
+        except Exception as e:
+            # Log any errors
+            self._log_gpt_interaction(
+                interaction_type="batch_sound_selection_error", 
+                input_data=input_data, 
+                response=str(e)
+            )
+            playback_logger.error("Error in batched sound file selection: %s", e)
+            return selections
+        
+        # Validate each choice; a missing or invalid sid leaves the word for its own selection
+        picked_queue = set(current_queue)
+        picked_queue.update(selected for selected in selections if selected)
+        gpt_sids = iter(_parse_sid_list(selected_text))
+        for i, word in enumerate(words):
+            if selections[i]:
+                continue
+            selected_sid = next(gpt_sids, None)
+            selected_filename = self._sid_table.get(selected_sid, selected_sid)
+            if selected_filename in filtered_sound_files and selected_filename not in picked_queue:
+                playback_logger.info("🎵 GPT selected sound file: %s for '%s' in a batch of %d",
+                                     selected_filename, word, len(gpt_words))
+                selections[i] = selected_filename
+                picked_queue.add(selected_filename)
+                self._remember_selection(cache_keys[i], selected_filename)
+        
+        return selections
+
+    async def aselect_each_with_gpt(self, words: list, contexts: list) -> list:
+        """
+        Run separate selections for several keywords at once on the shared async client
+        
+        :param words: Input keywords
+        :param contexts: Cultural context for each keyword
+        :return: Selected sound filename (or None) for each word, in order
+        """
+        results = await asyncio.gather(*[
+            self.aselect_sound_with_gpt(word, dict(cultural_context or {}))
+            for word, cultural_context in zip(words, contexts)
+        ], return_exceptions=True)
+        selections = []
+        for word, result in zip(words, results):
+            if isinstance(result, Exception):
+                playback_logger.error("Error selecting a sound for '%s': %s", word, result)
+                result = None
+            selections.append(result)
+        return selections
+
+    def _prepare_sound_selection(self, cultural_context: dict = None, current_time_seconds: float = None, current_section: dict = None):
+        """
+        Gather the context and candidate sounds for a GPT sound selection
+        
+        :param cultural_context: Context including performance time and cultural data
+        :param current_time_seconds: Performance time if the caller already read the clock
+        :param current_section: Section at current_time_seconds if the caller already looked it up
+        :return: Tuple of (cultural_context, current_queue, filtered_sound_files, catalog_text, candidate filename tuple)
+        """
         if cultural_context is None:
             cultural_context = {}
         
         # Get performance context
-        current_time_seconds = get_clock().get_elapsed_seconds()
-        current_section = self._get_current_section(current_time_seconds)
+        if current_time_seconds is None:
+            current_time_seconds = self._clock.get_elapsed_seconds()
+            current_section = None  # A section found for another time doesn't apply
+        if current_section is None:
+            current_section = self._get_current_section(current_time_seconds)
         
         # Enhance cultural context with performance data
         performance_context = {
-            "performance_time": get_time_str(),
+            "performance_time": _format_time(current_time_seconds),
             "performance_time_seconds": current_time_seconds
         }
         
@@ -515,208 +1175,173 @@ class AshariScoreManager:
         # Merge with existing cultural context
         cultural_context.update(performance_context)
         
-        # Prepare a comprehensive context
-        cultural_details = {
-            "overall_sentiment": cultural_context.get('overall_sentiment', 0),
-            "current_cultural_memory": {
-                value: score for value, score in self.ashari.cultural_memory.items()
-            },
-            "strongest_values": [
-                {"value": value, "score": score} 
-                for value, score in sorted(
-                    self.ashari.cultural_memory.items(), 
-                    key=lambda x: abs(x[1]), 
-                    reverse=True
-                )[:3]
-            ],
-            "performance_context": performance_context
-        }
-        
         # Get current queue for context
         current_queue = self.sound_manager.get_queue()
         
-        # Construct the system prompt
-        system_prompt = """
-            You are the Sound Selector for the Ashari cultural narrative. Your task is to choose the most thematically and emotionally appropriate sound file based on the given keyword and cultural context, specifically from the available sound files within the current section of the performance.
-
-            REQUIREMENTS:
-            1. ALWAYS return a VALID FILENAME from the available sound files within the **current section**.
-            2. Use the **dialogue section** as the primary method of selection.
-            3. Consider both the **current cultural memory** and the **performance timeline position**.
-            4. Match the sound file's dialogue to the input word's emotional and cultural resonance.
-            5. Select sounds that align with the **current section** of the performance (e.g., intro, middle, climactic).
-            6. DO NOT select any sound that is already in the **current playback queue**.
-
-            Selection Criteria:
-            - IMPORTANT: **Select only from the available sound files** in the **current section** of the performance.
-            - Avoid selecting any sound file that is **already in the current playback queue**.
-            - If a specific sound section is provided (e.g., **intro**, **middle**, **climactic**), **prefer sounds from that section**.
-            - Analyze how each sound file's dialogue connects to:
-              a) The input keyword
-              b) The current cultural sentiment
-              c) The strongest cultural values
-              d) The current performance theme
-            - Prioritize dialogues that:
-              - Reflect the **emotional nuance** of the keyword.
-              - Align with the **Ashari's current cultural stance**.
-              - Match the **current performance section's thematic elements**.
-              - Provide **depth and context** to the cultural experience.
-
-            Evaluation Process:
-            1. Read each dialogue carefully.
-            2. Compare the dialogue's themes to the keyword and cultural context.
-            3. Consider the **sentiment value** as a secondary factor.
-            4. Select the file that most profoundly captures the moment's **emotional** and **cultural significance** within the **current performance section**.
-
-            OUTPUT FORMAT:
-            - Respond ONLY with the **EXACT filename** of the chosen sound file.
-            - **NO additional explanation or text**.
-            - If no perfect match exists, choose the closest thematic representation.
-
-            """
-
         # Filter sounds based on performance section if applicable
         filtered_sound_files = self.sound_files
+        catalog_section = None
         if "mapped_sound_section" in performance_context:
             target_section = performance_context["mapped_sound_section"]
-            filtered_sound_files = {
-                filename: metadata 
-                for filename, metadata in self.sound_files.items()
-                if metadata.get('section') == target_section
-            }
+            filtered_sound_files = self._sound_files_by_section.get(target_section)
+            catalog_section = target_section
             
             # If no sounds in the preferred section, use all sounds
             if not filtered_sound_files:
                 filtered_sound_files = self.sound_files
-                print(f"⚠️ No sounds found in section '{target_section}', using all sounds")
-        
-        # Further filter to remove sounds that are already in the queue
-        filtered_sound_files = {
-            filename: metadata 
-            for filename, metadata in filtered_sound_files.items()
-            if filename not in current_queue
-        }
+                catalog_section = None
+                playback_logger.warning("⚠️ No sounds found in section '%s', using all sounds", target_section)
+        
+        # Set of queued sounds for constant-time membership checks below
+        queued = self.sound_manager.get_queued_set()
+        
+        # Use the prebuilt catalog text unless a queued sound has to be filtered out;
+        # walk the short queue rather than every candidate sound
+        excluded = frozenset(f for f in queued if f in filtered_sound_files)
+        if excluded:
+            # Further filter to remove sounds that are already in the queue
+            filtered_sound_files, catalog_text, candidate_names = self._catalog_without(catalog_section, excluded)
+        else:
+            catalog_text = self._catalog_text_by_section[catalog_section]
+            candidate_names = self._sound_names_by_section[catalog_section]
         
         # If all appropriate sounds are in the queue, revert to original filtered list
         if not filtered_sound_files:
-            print("⚠️ All sounds from the appropriate section are already in the queue.")
-            filtered_sound_files = {
-                filename: metadata 
-                for filename, metadata in self.sound_files.items()
-                if filename not in current_queue
-            }
+            playback_logger.warning("⚠️ All sounds from the appropriate section are already in the queue.")
+            filtered_sound_files, catalog_text, candidate_names = self._catalog_without(None, frozenset(f for f in queued if f in self.sound_files))
             
             # If absolutely all sounds are in the queue, use the full list as a last resort
             if not filtered_sound_files:
-                print("⚠️ All sounds are currently in the queue. Using full sound library.")
+                playback_logger.warning("⚠️ All sounds are currently in the queue. Using full sound library.")
                 filtered_sound_files = self.sound_files
+                catalog_text = self._catalog_text_by_section[None]
+                candidate_names = self._sound_names_by_section[None]
+        
+        return cultural_context, current_queue, filtered_sound_files, catalog_text, candidate_names
 
-        user_prompt = f"""
-            Select a sound file for the keyword: '{word}'
-
-            CULTURAL CONTEXT:
-            - Overall Sentiment: {cultural_context.get('overall_sentiment', 'N/A')}
-            - Key Cultural Values: {cultural_context.get('key_values', 'N/A')}
+    def _format_selection_prompt(self, word, cultural_context, current_queue, filtered_sound_files, catalog_text):
+        """Fill in the sound selection user prompt"""
+        return self.USER_PROMPT_TEMPLATE.format(
+            word=word,
+            overall_sentiment=cultural_context.get('overall_sentiment', 'N/A'),
+            key_values=cultural_context.get('key_values', 'N/A'),
+            performance_time=cultural_context.get('performance_time', 'N/A'),
+            current_section=cultural_context.get('current_section', 'N/A'),
+            section_progress=cultural_context.get('section_progress', 'N/A'),
+            current_theme=cultural_context.get('current_theme', 'N/A'),
+            mapped_sound_section=cultural_context.get('mapped_sound_section', 'N/A'),
+            queue=_compact_json([self._sid_by_filename.get(f, f) for f in current_queue]),
+            catalog=catalog_text
+        )
 
-            PERFORMANCE CONTEXT:
-            - Current Time: {cultural_context.get('performance_time', 'N/A')}
-            - Current Section: {cultural_context.get('current_section', 'N/A')}
-            - Section Progress: {cultural_context.get('section_progress', 'N/A')}
-            - Current Theme: {cultural_context.get('current_theme', 'N/A')}
-            - Preferred Sound Section: {cultural_context.get('mapped_sound_section', 'N/A')}
-
-            CURRENT PLAYBACK QUEUE:
-            {json.dumps(current_queue, indent=2)}
-            IMPORTANT: Do NOT select any sound file that is already in this queue.
+    def _selection_cache_key(self, word, cultural_context):
+        """
+        Key a GPT selection by the keyword and the parts of the context that steer it
+        
+        :param word: Input keyword
+        :param cultural_context: Context returned by _prepare_sound_selection
+        :return: Hashable cache key
+        """
+        sentiment = cultural_context.get('overall_sentiment', 0)
+        if isinstance(sentiment, (int, float)):
+            sentiment = round(sentiment, 1)
+        return (
+            word.lower(),
+            cultural_context.get('current_section'),
+            cultural_context.get('current_theme'),
+            sentiment,
+        )
 
-            AVAILABLE SOUND FILES:
-            {json.dumps([
-                {
-                    "filename": filename, 
-                    "sentiment": metadata['sentiment_value'], 
-                    "dialogue": metadata['dialogue'], 
-                    "section": metadata['section']
-                } for filename, metadata in filtered_sound_files.items()
-            ], indent=2)}
+    def _cached_selection(self, cache_key, current_queue, filtered_sound_files):
+        """
+        Get a cached selection if it's still a candidate and not already queued
+        
+        :param cache_key: Key from _selection_cache_key
+        :param current_queue: Playback queue at selection time
+        :param filtered_sound_files: Candidate sounds for the selection
+        :return: Sound filename or None
+        """
+        with self._cache_lock:
+            filename = self._selection_cache.get(cache_key)
+            if filename is None or filename not in filtered_sound_files or filename in current_queue:
+                return None
+            self._selection_cache.move_to_end(cache_key)
+        playback_logger.debug("♻️ Reusing selection for '%s': %s", cache_key[0], filename)
+        return filename
 
-            ADDITIONAL GUIDANCE:
-            - DO NOT select any sound that is already in the current playback queue
-            - Deeply consider how the dialogues resonate with the Ashari's current cultural state
-            - The chosen sound should align with the current performance section theme
-            - The sound should feel like a profound cultural reflection appropriate for this moment
-            """
+    def _remember_selection(self, cache_key, filename):
+        """
+        Store a GPT selection for reuse, evicting the least recently used one if full
         
-        # Prepare input data for logging
-        input_data = {
-            "word": word,
-            "system_prompt": system_prompt,
-            "user_prompt": user_prompt,
-            "cultural_context": cultural_context,
-            "current_queue": current_queue
-        }
+        :param cache_key: Key from _selection_cache_key
+        :param filename: Sound filename GPT chose
+        """
+        with self._cache_lock:
+            self._selection_cache[cache_key] = filename
+            self._selection_cache.move_to_end(cache_key)
+            if len(self._selection_cache) > SELECTION_CACHE_SIZE:
+                self._selection_cache.popitem(last=False)
+
+    def _resolve_selected_sound(self, selected_filename, word, cultural_context, current_queue, candidate_names):
+        """
+        Validate GPT's choice, swapping in an alternative if it's queued or invalid
+        
+        :param selected_filename: Filename GPT chose
+        :param word: Keyword the sound was chosen for
+        :param cultural_context: Context used for the selection
+        :param current_queue: Playback queue at selection time
+        :param candidate_names: Tuple of candidate sound filenames for the selection
+        :return: Sound filename to queue or None
+        """
+        if selected_filename == "N/A":
+            playback_logger.warning("⚠️ No suitable sound file found for '%s'", word)
+            return None
         
-        try:
-            # Call GPT to select the sound file
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=50  # We only want the filename
-            )
-            
-            # Extract the filename
-            selected_filename = response.choices[0].message.content.strip()
-            
-            # Log the interaction
-            self._log_gpt_interaction(
-                interaction_type="sound_selection", 
-                input_data=input_data, 
-                response=selected_filename
-            )
-            
-            # Validate the filename
-            if selected_filename == "N/A":
-                print(f"⚠️ No suitable sound file found for '{word}'")
-                return None
-            
-            if selected_filename in self.sound_files:
-                if selected_filename in current_queue:
-                    print(f"⚠️ GPT selected a sound already in the queue: {selected_filename}")
-                    # Find an alternative that's not in the queue
-                    available_sounds = [f for f in filtered_sound_files.keys() if f not in current_queue]
-                    if available_sounds:
-                        import random
-                        alternative = random.choice(available_sounds)
-                        print(f"🔄 Using alternative sound instead: {alternative}")
-                        return alternative
-                    else:
-                        print(f"Using the suggested sound despite queue duplication: {selected_filename}")
+        queued = set(current_queue)
+        if selected_filename in self._sound_filenames_set:
+            if selected_filename in queued:
+                playback_logger.warning("⚠️ GPT selected a sound already in the queue: %s", selected_filename)
+                # Find an alternative that's not in the queue
+                alternative = self._pick_unqueued_sound(candidate_names, queued)
+                if alternative:
+                    playback_logger.info("🔄 Using alternative sound instead: %s", alternative)
+                    return alternative
                 else:
-                    print(f"🎵 GPT selected sound file: {selected_filename} for '{word}' in {cultural_context.get('current_section', 'unknown')} section")
-                return selected_filename
+                    playback_logger.info("Using the suggested sound despite queue duplication: %s", selected_filename)
             else:
-                print(f"⚠️ Invalid sound file selected: {selected_filename}")
-                
-                # Fallback: select a random sound from the filtered list that's not in the queue
-                filtered_not_in_queue = [f for f in filtered_sound_files.keys() if f not in current_queue]
-                if filtered_not_in_queue:
-                    import random
-                    fallback = random.choice(filtered_not_in_queue)
-                    print(f"Using fallback sound: {fallback}")
-                    return fallback
-                return None
+                playback_logger.info("🎵 GPT selected sound file: %s for '%s' in %s section",
+                                     selected_filename, word, cultural_context.get('current_section', 'unknown'))
+            return selected_filename
+        else:
+            playback_logger.warning("⚠️ Invalid sound file selected: %s", selected_filename)
+            
+            # Fallback: select a random sound from the filtered list that's not in the queue
+            fallback = self._pick_unqueued_sound(candidate_names, queued)
+            if fallback:
+                playback_logger.info("Using fallback sound: %s", fallback)
+            return fallback
+
+    @staticmethod
+    def _pick_unqueued_sound(candidates, queued, attempts=3):
+        """
+        Pick a random candidate sound that isn't queued
         
-        except Exception as e:
-            # Log any errors
-            self._log_gpt_interaction(
-                interaction_type="sound_selection_error", 
-                input_data=input_data, 
-                response=str(e)
-            )
-            print(f"Error in sound file selection: {e}")
+        Candidates usually have queued sounds filtered out already, so a few random
+        draws almost always succeed; the filtered scan only runs if they all collide.
+        
+        :param candidates: Tuple of candidate sound filenames, prebuilt so no copy is made per call
+        :param queued: Set of queued sound filenames
+        :param attempts: Random draws to try before scanning
+        :return: Sound filename or None if every candidate is queued
+        """
+        if not candidates:
             return None
+        for _ in range(attempts):
+            choice = random.choice(candidates)
+            if choice not in queued:
+                return choice
+        available = [f for f in candidates if f not in queued]
+        return random.choice(available) if available else None
 
     def select_end_clip_with_gpt(self, cultural_context: dict = None) -> str:
         """
@@ -744,48 +1369,22 @@ class AshariScoreManager:
         # Get the strongest values (most influential in the journey)
         strongest_values = [
             {"value": value, "score": score} 
-            for value, score in sorted(
-                self.ashari.cultural_memory.items(), 
-                key=lambda x: abs(x[1]), 
-                reverse=True
-            )[:5]  # Get top 5 values
+            for value, score in self.ashari.get_strongest_values(5)  # Get top 5 values
         ]
         
         # Calculate overall sentiment from cultural memory
         overall_sentiment = sum(score for score in cultural_memory.values()) / len(cultural_memory) if cultural_memory else 0
         sentiment_description = "positive" if overall_sentiment > 0.1 else "negative" if overall_sentiment < -0.1 else "neutral"
         
-        # Get descriptions of each end clip
+        # Describe each end clip by its summarized dialogue, keyed by filename
         end_clip_descriptions = {}
         for clip in end_clips:
             metadata = self.sound_files.get(clip, {})
             end_clip_descriptions[clip] = {
-                "filename": clip,
-                "dialogue": metadata.get("dialogue", ""),
+                "dialogue": self._dialogue_summary.get(clip) or _summarize_dialogue(metadata.get("dialogue", "")),
                 "sentiment": metadata.get("sentiment_value", 0)
             }
         
-        # Construct the system prompt
-        system_prompt = """
-            You are the Conclusion Selector for the Ashari cultural narrative. Your task is to select the most appropriate ending clip that resonates with the Ashari's cultural journey.
-
-            REQUIREMENTS:
-            1. ALWAYS return a VALID FILENAME from the available **ending clips** in the **End section**.
-            2. Select a clip that reflects the **overall sentiment** and **cultural values** that have been dominant throughout the journey.
-            3. The ending should feel like a **natural conclusion** to the Ashari's story.
-            4. Consider the description of each clip and how it matches the **emotional tone** of the journey.
-
-            Selection Criteria:
-            - Match the clip's atmosphere with the **overall sentiment** of the Ashari's cultural development.
-            - Consider how the **ending clip's description** resonates with the strongest cultural values.
-            - Select an ending that provides **emotional closure** to the narrative journey.
-            - Choose an ending that feels **authentic** to the Ashari's experience.
-
-            OUTPUT FORMAT:
-            - Respond ONLY with the **EXACT filename** of the chosen ending clip.
-            - **NO additional explanation or text**.
-        """
-        
         # Construct the user prompt
         user_prompt = f"""
         Select the most appropriate ending clip for the Ashari cultural narrative:
@@ -795,17 +1394,17 @@ class AshariScoreManager:
         - Journey Duration: {cultural_context.get('performance_time', 'Unknown')}
         
         TOP INFLUENTIAL VALUES:
-        {json.dumps(strongest_values, indent=2)}
+        {_compact_json(strongest_values)}
         
         AVAILABLE ENDING CLIPS:
-        {json.dumps(end_clip_descriptions, indent=2)}
+        {_compact_json(end_clip_descriptions)}
         
         The ending clip should provide a meaningful conclusion that reflects the Ashari's cultural journey and dominant values.
         """
         
         # Prepare input data for logging
         input_data = {
-            "system_prompt": system_prompt,
+            "system_prompt_hash": self.END_CLIP_SYSTEM_PROMPT_HASH,
             "user_prompt": user_prompt,
             "cultural_context": cultural_context,
             "cultural_memory": cultural_memory,
@@ -819,7 +1418,7 @@ class AshariScoreManager:
             response = self.client.chat.completions.create(
                 model="gpt-4o",
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": self.END_CLIP_SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=50  # We only want the filename
@@ -841,7 +1440,6 @@ class AshariScoreManager:
             else:
                 print(f"⚠️ Invalid ending clip selected: {selected_filename}")
                 # Fallback: select a random end clip
-                import random
                 fallback = random.choice(end_clips)
                 print(f"Using fallback ending clip: {fallback}")
                 return fallback
@@ -855,26 +1453,26 @@ class AshariScoreManager:
             )
             print(f"Error in ending clip selection: {e}")
             # Fallback: select a random end clip
-            import random
             fallback = random.choice(end_clips)
             print(f"Using fallback ending clip due to error: {fallback}")
             return fallback
     
-    def queue_sounds(self, word: str, cultural_context: dict = None):
+    def queue_sounds(self, word: str, cultural_context: dict = None, preselected_sound: str = None, use_gpt: bool = True):
         """
         Queue appropriate sound files for a given word
         
         :param word: Input word to find matching sounds
         :param cultural_context: Optional additional context about the cultural interpretation
+        :param preselected_sound: Sound already chosen by a batched selection, skips the GPT call
+        :param use_gpt: If False, a missing preselected_sound goes straight to the section default
         """
         # Check if we're past the end of the End section
-        from performance_clock import get_clock
-        current_time = get_clock().get_elapsed_seconds()
+        current_time = self._clock.get_elapsed_seconds()
         current_section = self._get_current_section(current_time)
         
         # Check if end transition has played - if so, don't allow new clips
         if self._end_transition_played:
-            print("🏁 End transition has already played - no more clips can be added")
+            playback_logger.info("🏁 End transition has already played - no more clips can be added")
             return None
 
         # If we're in the End section and past its end_seconds, or the performance ended flag is set
@@ -883,8 +1481,8 @@ class AshariScoreManager:
             end_section_end_time = current_section.get("end_time_seconds", float('inf'))
             if current_time >= end_section_end_time:
                 self._performance_ended = True  # Set the flag for future use
-                print(f"🛑 Performance has ended (time: {current_time:.1f}s, End section end: {end_section_end_time:.1f}s)")
-                print(f"🛑 No more clips can be added to the queue")
+                playback_logger.info("🛑 Performance has ended (time: %.1fs, End section end: %.1fs)", current_time, end_section_end_time)
+                playback_logger.info("🛑 No more clips can be added to the queue")
                 return None
         
         # Special handling for "begin"
@@ -893,20 +1491,25 @@ class AshariScoreManager:
             current_queue = self.sound_manager.get_queue()
             if "welcome.mp3" not in current_queue:
                 self.sound_manager.add_to_queue("welcome.mp3", priority=True)
-                print(f"🎬 Starting performance with initial sound: welcome.mp3")
+                playback_logger.info("🎬 Starting performance with initial sound: welcome.mp3")
 
         if word.lower() == "test":
-            print("TEST")
+            playback_logger.debug("TEST")
+        
+        # A sound added behind a full queue may not play before the section changes, so skip the GPT call
+        if len(self.sound_manager.get_queue()) >= self._max_queue_size:
+            playback_logger.info("⚠️ Queue is full (%d sounds), not selecting a sound for '%s'", self._max_queue_size, word)
+            return None
         
         # Use GPT to select the most appropriate sound file
-        selected_sound = self.select_sound_with_gpt(word, cultural_context)
+        selected_sound = preselected_sound
+        if selected_sound is None and use_gpt:
+            selected_sound = self.select_sound_with_gpt(
+                word, cultural_context, current_time_seconds=current_time, current_section=current_section
+            )
         
         # If no sound is selected, attempt to add a default sound for the current section
         if selected_sound is None or selected_sound == "None":
-            # Get current time from performance clock
-            current_time = get_clock().get_elapsed_seconds()
-            current_section = self._get_current_section(current_time)
-            
             if current_section:
                 # Map performance section to sound section
                 sound_section = current_section['section_name']
@@ -916,83 +1519,132 @@ class AshariScoreManager:
                 
                 if section_sounds:
                     # Choose a random sound from the appropriate section
-                    import random
                     selected_sound = random.choice(section_sounds)
-                    print(f"🎵 Added default sound {selected_sound} for section {sound_section}")
+                    playback_logger.info("🎵 Added default sound %s for section %s", selected_sound, sound_section)
                 else:
                     # Fallback to a generic sound if no section-specific sounds found
                     if self.sound_files:
-                        selected_sound = list(self.sound_files.keys())[0]
-                        print("⚠️ No appropriate sounds found, using first available sound")
+                        selected_sound = next(iter(self.sound_files))
+                        playback_logger.warning("⚠️ No appropriate sounds found, using first available sound")
                     else:
-                        print("❌ No sounds available at all!")
+                        playback_logger.error("❌ No sounds available at all!")
                         return None
         
         # If still no sound, log and return
         if selected_sound is None or selected_sound == "None":
-            print("❌ No sounds available to play")
+            playback_logger.error("❌ No sounds available to play")
             return None
         
-        # Add the selected sound to the playback queue
-        current_queue = self.sound_manager.get_queue()
-        if not current_queue:
-            self.sound_manager.add_to_queue(selected_sound)
-        elif selected_sound not in current_queue:
-            # Only add if not already in queue
-            self.sound_manager.add_to_queue(selected_sound)
-        else:
-            print(f"⚠️ Sound {selected_sound} already in queue, not adding again")
+        # Add the selected sound unless another caller queued it or filled the queue during selection
+        if not self.sound_manager.add_to_queue(selected_sound, unique=True, max_size=self._max_queue_size):
+            playback_logger.info("⚠️ Sound %s already in queue or queue is full, not adding again", selected_sound)
         
         # Ensure playback is running
         self.start_playback()
         
         return selected_sound
     
-    def _log_gpt_interaction(self, interaction_type: str, input_data: dict, response: str = None):
-        """Log GPT interaction details"""
-        # Generate unique filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        filename = os.path.join(self.log_dir, f"gpt_log_{interaction_type}_{timestamp}.json")
+    def submit_sound(self, word: str, cultural_context: dict = None):
+        """
+        Queue sounds for a word on a worker thread instead of blocking the caller
+        
+        A free worker picks the word up straight away. During a burst, words that arrive
+        while every worker is busy are selected together in one batched GPT request.
         
-        # Prepare log entry
-        log_entry = {
+        :param word: Input word to find matching sounds
+        :param cultural_context: Optional additional context about the cultural interpretation
+        :return: Future resolving to the queued sound filename (or None)
+        """
+        future = Future()
+        future.add_done_callback(self._report_submit_error)
+        with self._pending_words_lock:
+            self._pending_words.append((word, cultural_context, future))
+            start_drain = self._pending_drains < GPT_WORKERS
+            if start_drain:
+                self._pending_drains += 1
+        if start_drain:
+            self._gpt_executor.submit(self._drain_pending_words)
+        return future
+    
+    def _drain_pending_words(self):
+        """Worker loop for submit_sound: queue sounds for every waiting word, then exit"""
+        while True:
+            with self._pending_words_lock:
+                pending = self._pending_words
+                self._pending_words = []
+                if not pending:
+                    self._pending_drains -= 1
+                    return
+            
+            # Select a burst in one request, using the most recent context
+            selections = [None] * len(pending)
+            batched = len(pending) > 1
+            if batched:
+                try:
+                    selections = self.select_sounds_with_gpt([word for word, _, _ in pending], pending[-1][1])
+                except Exception as e:
+                    playback_logger.error("Error in batched sound file selection: %s", e)
+                
+                # Words the batch didn't cover get their own selections, run concurrently
+                missing = [i for i, selected in enumerate(selections) if not selected]
+                if missing:
+                    retried = self._run_on_gpt_loop(self.aselect_each_with_gpt(
+                        [pending[i][0] for i in missing], [pending[i][1] for i in missing]
+                    ))
+                    for i, selected in zip(missing, retried):
+                        selections[i] = selected
+            
+            # Queue in arrival order
+            for (word, cultural_context, future), selected_sound in zip(pending, selections):
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(self.queue_sounds(word, cultural_context, preselected_sound=selected_sound, use_gpt=not batched))
+                except Exception as e:
+                    future.set_exception(e)
+    
+    @staticmethod
+    def _report_submit_error(future):
+        """Print errors from submit_sound, which would otherwise stay inside the Future"""
+        if not future.cancelled() and future.exception() is not None:
+            print(f"Error queuing sound: {future.exception()}")
+    
+    def _log_gpt_interaction(self, interaction_type: str, input_data: dict, response: str = None):
+        """Queue GPT interaction details for the background log writer"""
+        self._log_queue.put({
             "timestamp": datetime.now().isoformat(),
             "interaction_type": interaction_type,
             "input": input_data,
             "response": response
-        }
-        
-        # Write to log file
+        })
+
+    def _log_writer(self):
+        """Background thread that appends queued GPT log entries to a single JSONL file"""
+        log_path = os.path.join(self.log_dir, "gpt_log.jsonl")
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(log_entry, f, indent=2)
-            print(f"✅ Logged GPT interaction to {filename}")
+            with open(log_path, 'a', encoding='utf-8') as f:
+                stopping = False
+                while not stopping:
+                    # Block for one entry, then drain whatever else is queued so a burst is one flush
+                    log_entries = [self._log_queue.get()]
+                    while True:
+                        try:
+                            log_entries.append(self._log_queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    
+                    for log_entry in log_entries:
+                        if log_entry is None:
+                            stopping = True
+                            continue
+                        try:
+                            f.write(_compact_json(log_entry) + '\n')
+                        except Exception as e:
+                            print(f"❌ Error logging GPT interaction: {e}")
+                    f.flush()
         except Exception as e:
-            print(f"❌ Error logging GPT interaction: {e}")
-
-    # def print_channel_status(self):
-    #     """Print the status of all pygame mixer channels to diagnose playback issues"""
-    #     # Delegate to sound manager
-    #     if hasattr(self.sound_manager, 'print_channel_status'):
-    #         self.sound_manager.print_channel_status()
-    #     else:
-    #         print("\n🔊 CHANNEL STATUS REPORT:")
-    #         print(f"Total channels: {pygame.mixer.get_num_channels()}")
-            
-    #         busy_channels = 0
-    #         for i in range(pygame.mixer.get_num_channels()):
-    #             channel = pygame.mixer.Channel(i)
-    #             is_busy = channel.get_busy()
-    #             volume = channel.get_volume()
-                
-    #             if is_busy:
-    #                 busy_channels += 1
-    #                 print(f"  Channel {i}: BUSY (vol={volume:.2f})")
-            
-    #         print(f"Busy channels: {busy_channels}/{pygame.mixer.get_num_channels()} ({busy_channels/pygame.mixer.get_num_channels()*100:.1f}%)")
-    #         print(f"Current queue: {self.sound_manager.get_queue()}")
-    #         print("-" * 40)
-    
+            print(f"❌ Error opening GPT log {log_path}: {e}")
+
     def stop_sounds(self):
         """Stop current sound playback"""
         # Delegate to sound manager
@@ -1023,10 +1675,22 @@ class AshariScoreManager:
         # Stop playback
         self.stop_sounds()
         
+        # Drop selections that haven't started yet
+        self._gpt_executor.shutdown(wait=False, cancel_futures=True)
+        with self._pending_words_lock:
+            for _, _, future in self._pending_words:
+                future.cancel()
+            self._pending_words = []
+        self._gpt_loop.call_soon_threadsafe(self._gpt_loop.stop)
+        
         # Stop background loaders
         if hasattr(self.audio_manager, 'stop_background_loader'):
             self.audio_manager.stop_background_loader()
         
+        # Flush pending GPT logs
+        self._log_queue.put(None)
+        self._log_thread.join(timeout=1)
+        
         # Stop any pygame resources
         pygame.mixer.quit()
         
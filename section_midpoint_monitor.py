@@ -1,6 +1,7 @@
 import threading
 import time
 import os
+from bisect import bisect_left, bisect_right
 from performance_clock import get_clock
 import movement
 
@@ -66,6 +67,7 @@ def monitor_section_midpoints(sections, score_manager):
     
     # Sort sections by midpoint time for efficient checking
     sections = sorted(sections, key=lambda s: s["midpoint"])
+    midpoints = [s["midpoint"] for s in sections]
     
     print("🔍 Starting section midpoint monitoring...")
     
@@ -78,15 +80,17 @@ def monitor_section_midpoints(sections, score_manager):
             if current_time - last_log_time >= log_interval:
                 print(f"🔍 Section midpoint monitor active - current time: {format_time(current_time)}")
                 # Log upcoming midpoints
-                upcoming = [s for s in sections if s["midpoint"] > current_time]
-                if upcoming:
-                    next_section = upcoming[0]
+                next_index = bisect_right(midpoints, current_time)
+                if next_index < len(sections):
+                    next_section = sections[next_index]
                     time_remaining = next_section["midpoint"] - current_time
                     print(f"  Next midpoint: {next_section['name']} in {format_time(time_remaining)} seconds")
                 last_log_time = current_time
             
-            # Check each section midpoint
-            for section in sections:
+            # Only midpoints within 1 second of now can trigger, so bisect to that window
+            window_start = bisect_right(midpoints, current_time - 1.0)
+            window_end = bisect_left(midpoints, current_time + 1.0)
+            for section in sections[window_start:window_end]:
                 section_name = section["name"]
                 midpoint_time = section["midpoint"]
                 
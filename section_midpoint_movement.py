@@ -1,5 +1,6 @@
 import os
 import json
+import random
 import time
 from movement import generate_movement_score
 from haiku import send_haiku_to_webapp
@@ -24,16 +25,12 @@ def generate_midpoint_movement(ashari, section, current_time_seconds):
         # Capture the current state of cultural memory at this moment
         current_cultural_memory = dict(ashari.cultural_memory)
         
-        # Identify the most extreme cultural value at this moment
-        extreme_values = sorted(
+        # Identify the most extreme cultural value at this moment (one pass, no full sort)
+        most_extreme_value, extreme_value_score = max(
             current_cultural_memory.items(), 
-            key=lambda x: abs(x[1]), 
-            reverse=True
+            key=lambda x: abs(x[1])
         )
         
-        # Select the most extreme value
-        most_extreme_value, extreme_value_score = extreme_values[0]
-        
         # Generate movement score based on the extreme value
         movement_score = generate_movement_score(most_extreme_value)
         
@@ -72,7 +69,6 @@ def generate_midpoint_movement(ashari, section, current_time_seconds):
         
         # Subtle modification of cultural memory to create organic evolution
         for value in ashari.cultural_memory:
-            import random
             fluctuation = random.uniform(-0.02, 0.02)
             ashari.cultural_memory[value] += fluctuation
             # Ensure values stay within -1 to 1 range
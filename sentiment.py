@@ -1,11 +1,8 @@
 import config
 import ollama
 
-def estimate_sentiment_with_ollama(word):
-    print(f"Finding sentiment score for: {word} \n")
-    try:
-        # Prepare the prompt for Ollama
-        system_prompt = """
+# System prompt for sentiment scoring, shared by every call
+SENTIMENT_SYSTEM_PROMPT = """
         You are a sentiment analyzer for the Ashari culture, a fictional society with complex cultural values.
         
         Rate the sentiment of concepts on a scale from -1.0 to 1.0 with exactly one decimal place.
@@ -24,14 +21,18 @@ def estimate_sentiment_with_ollama(word):
         
         Your output must be ONLY a number between -1.0 and 1.0.
         """
-        
+
+def estimate_sentiment_with_ollama(word):
+    print(f"Finding sentiment score for: {word} \n")
+    try:
+        # Prepare the prompt for Ollama
         prompt = f"What is the sentiment value of '{word}' to the Ashari culture?"
         
         # Generate sentiment using Ollama
         response = ollama.chat(
             model="llama3.2",
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": SENTIMENT_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ]
         )
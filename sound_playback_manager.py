@@ -4,7 +4,22 @@ import time
 import pygame
 import logging
 import json
+from collections import deque
 from drone_note_utils import send_drone_notes
+from ashari_logger import playback_logger
+from audio_mixer import ensure_mixer
+
+# The mixer grows its channel pool up to this size before it starts cutting off sounds
+MAX_MIXER_CHANNELS = 256
+
+# Low channels the playback loop crossfades between, kept out of find_channel's pool
+RESERVED_CHANNELS = 16
+
+# Reserved channel right after the playback loop's, kept idle for the End section's final clip
+FINALE_CHANNEL = RESERVED_CHANNELS
+
+# Channels available to claim_channel at startup, on top of the reserved ones
+CLAIMABLE_CHANNELS = 16
 
 class SoundPlaybackManager:
     """
@@ -20,59 +35,157 @@ class SoundPlaybackManager:
         # Store the audio manager
         self.audio_manager = audio_manager
         
-        # Initialize pygame mixer if not already initialized
-        if not pygame.mixer.get_init():
-            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=4096)
+        # The mixer is opened on first playback or channel claim, not here
         
-        # Set up mixer with enough channels
-        pygame.mixer.set_num_channels(64)
-        
-        # Playback queue
-        self.playback_queue = []
+        # Playback queue; every change is made under the lock and republished as an immutable
+        # snapshot, so readers get the queue by reference without locking or copying.
+        # Writers need the lock even for single deque calls: the unique/max_size checks,
+        # the empty-queue requeue and the crossfade pop all check the queue before changing it
+        self.playback_queue = deque()
         self._playback_lock = threading.Lock()
+        self._queue_snapshot = ()
+        self._queue_set = frozenset()
         
         # Playback thread
         self._playback_thread = None
         self._stop_event = threading.Event()
         
+        # Wakes the playback thread early when the queue changes or playback stops
+        self._wakeup_event = threading.Event()
+        
         # Playback state tracking
         self._current_sound = None
         self._current_channel = None
         self._current_sound_end_time = 0
         
+        # Crossfade being advanced by the playback loop, or None
+        self._fade_state = None
+        
         # Add performance ended flag
         self._performance_ended = False
         
         # Parent score manager reference
         self.parent_score_manager = None
         
+        # Set once the mixer has been opened and sized for playback
+        self._mixer_ready = False
+        
+        # Webapp client and frequency generator for drone notes, imported and created on first use
+        self._drone_client = None
+        
+        # Channels handed out by claim_channel, oldest first, so a full mixer can evict in O(1)
+        self._channel_order = deque(maxlen=MAX_MIXER_CHANNELS)
+        self._channel_order_lock = threading.Lock()
+        
         print("Sound Playback Manager initialized")
     
-    def add_to_queue(self, sound_file, priority=False):
+    def add_to_queue(self, sound_file, priority=False, unique=False, max_size=None):
         """
         Add a sound file to the playback queue
         
+        The unique and max_size checks are made under the same lock as the insert,
+        so concurrent callers can't both add the same sound.
+        
         :param sound_file: Name of the sound file
         :param priority: If True, add to the front of the queue
+        :param unique: If True, don't add a sound that is already queued
+        :param max_size: If set, don't add to a queue already holding this many sounds
+        :return: True if the sound was added
         """
         with self._playback_lock:
+            if unique and sound_file in self._queue_set:
+                return False
+            if max_size is not None and len(self.playback_queue) >= max_size:
+                return False
             if priority:
-                self.playback_queue.insert(0, sound_file)
-                print(f"🔝 Added sound to front of queue: {sound_file}")
+                self.playback_queue.appendleft(sound_file)
             else:
                 self.playback_queue.append(sound_file)
-                print(f"🎶 Added sound to queue: {sound_file}")
+            self._publish_queue()
+        self._wakeup_event.set()
+        
+        # Logged through the playback logger's queue so GPT worker threads don't contend for stdout
+        if priority:
+            playback_logger.info("🔝 Added sound to front of queue: %s", sound_file)
+        else:
+            playback_logger.info("🎶 Added sound to queue: %s", sound_file)
+        
+        # Start decoding now so playback doesn't stall on it later
+        if self.audio_manager:
+            self.audio_manager.prefetch_sound(sound_file)
+        return True
+    
+    def claim_channel(self):
+        """
+        Find a free mixer channel, growing the mixer or stopping the oldest claimed sound if none is free
+        
+        :return: pygame.mixer.Channel or None if no channel could be freed
+        """
+        self._ensure_mixer()
+        channel = pygame.mixer.find_channel()
+        
+        # Mixer channels are cheap, so add more before cutting anything off
+        if channel is None:
+            num_channels = pygame.mixer.get_num_channels()
+            if num_channels < MAX_MIXER_CHANNELS:
+                new_channels = min(num_channels * 2, MAX_MIXER_CHANNELS)
+                playback_logger.warning("⚠️ Increasing channels to %d", new_channels)
+                pygame.mixer.set_num_channels(new_channels)
+                channel = pygame.mixer.find_channel()
+        
+        if channel is None:
+            oldest = None
+            with self._channel_order_lock:
+                while self._channel_order:
+                    oldest = self._channel_order.popleft()
+                    if oldest.get_busy():
+                        break
+            if oldest is not None:
+                playback_logger.warning("⚠️ No available channel, stopping the oldest sound to make room")
+                oldest.stop()
+                channel = oldest
+        
+        if channel is not None:
+            with self._channel_order_lock:
+                self._channel_order.append(channel)
+        return channel
+    
+    def _ensure_mixer(self):
+        """Open the mixer on first use, sized for the playback loop's channels, the finale channel and claimable ones"""
+        if not self._mixer_ready:
+            ensure_mixer(num_channels=FINALE_CHANNEL + 1 + CLAIMABLE_CHANNELS, reserved=FINALE_CHANNEL + 1)
+            self._mixer_ready = True
+    
+    def get_finale_channel(self):
+        """
+        Get the reserved channel for the final clip
+        
+        It is never handed out by find_channel or claim_channel, so it is free when the End section starts.
+        
+        :return: pygame.mixer.Channel
+        """
+        self._ensure_mixer()
+        return pygame.mixer.Channel(FINALE_CHANNEL)
     
     def clear_queue(self):
         """Clear the playback queue"""
         with self._playback_lock:
             self.playback_queue.clear()
-            print("🧹 Playback queue cleared")
+            self._publish_queue()
+        print("🧹 Playback queue cleared")
+    
+    def _publish_queue(self):
+        """Rebuild the queue snapshot after a change; call with _playback_lock held"""
+        self._queue_snapshot = tuple(self.playback_queue)
+        self._queue_set = frozenset(self._queue_snapshot)
     
     def get_queue(self):
-        """Get a copy of the current playback queue"""
-        with self._playback_lock:
-            return list(self.playback_queue)
+        """Get the current playback queue as an immutable tuple"""
+        return self._queue_snapshot
+    
+    def get_queued_set(self):
+        """Get the sounds currently in the playback queue as a frozenset"""
+        return self._queue_set
     
     def start_playback(self):
         """Start continuous playback"""
@@ -80,6 +193,8 @@ class SoundPlaybackManager:
         if self._playback_thread and self._playback_thread.is_alive():
             return
         
+        self._ensure_mixer()
+        
         # Reset stop flag
         self._stop_event.clear()
         
@@ -94,6 +209,7 @@ class SoundPlaybackManager:
         """Stop playback"""
         # Signal the playback thread to stop
         self._stop_event.set()
+        self._wakeup_event.set()
         
         # Stop all sounds
         pygame.mixer.stop()
@@ -133,10 +249,100 @@ class SoundPlaybackManager:
         # If no parent or access failed, return None
         return None
     
+    def _is_performance_ended(self):
+        """
+        Check whether the performance has ended
+        
+        The score manager sets its own flag when the End section finishes, so
+        check it as well as this manager's flag.
+        
+        Returns:
+            bool: True if no more sounds should be looped
+        """
+        if self._performance_ended:
+            return True
+        return bool(self.parent_score_manager and getattr(self.parent_score_manager, '_performance_ended', False))
+    
+    def _requeue_and_report(self, current_sound_file, pop=True):
+        """
+        Get the next sound, re-queuing the current one to loop it if the queue is empty
+        
+        Sounds aren't looped in the Final section or once the performance has ended.
+        The empty queue is logged once each time it runs dry.
+        
+        :param current_sound_file: Sound that is playing or just finished, or None
+        :param pop: If True remove the next sound from the queue, otherwise just peek at it
+        :return: Tuple of (queue_was_empty, next sound filename or None)
+        """
+        current_section = self._get_current_section_name()
+        next_sound_file = None
+        with self._playback_lock:
+            queue_was_empty = not self.playback_queue
+            if queue_was_empty and current_sound_file and current_section != "Final" and not self._is_performance_ended():
+                self.playback_queue.append(current_sound_file)
+            
+            if self.playback_queue:
+                next_sound_file = self.playback_queue.popleft() if pop else self.playback_queue[0]
+            
+            if pop or queue_was_empty:
+                self._publish_queue()
+        
+        # Log outside the lock
+        if queue_was_empty and not self._empty_queue_logged:
+            playback_logger.info("🔄 Queue is now empty")
+            self._empty_queue_logged = True
+        elif not queue_was_empty:
+            # Reset the empty queue logged flag when we have items again
+            self._empty_queue_logged = False
+        
+        return queue_was_empty, next_sound_file
+    
+    def _get_drone_client(self):
+        """
+        Get the webapp client and frequency generator used to send drone notes
+        
+        api_client is imported on first use so a missing webapp dependency only disables drone notes.
+        
+        :return: Tuple of (WebAppClient, generate_drone_frequencies)
+        """
+        if self._drone_client is None:
+            from api_client import generate_drone_frequencies, WebAppClient
+            self._drone_client = (WebAppClient(), generate_drone_frequencies)
+        return self._drone_client
+    
+    def _prefetch_upcoming(self, sound_files):
+        """
+        Start decoding upcoming sounds so the playback thread finds them cached
+        
+        :param sound_files: Filenames expected to play next
+        """
+        if not self.audio_manager:
+            return
+        for sound_file in sound_files:
+            self.audio_manager.prefetch_sound(sound_file)
+    
+    def _get_playback_duration(self, sound, sound_file):
+        """
+        Get how long a sound will keep its channel busy
+        
+        :param sound: pygame.mixer.Sound object
+        :param sound_file: Name of the sound file, used for the metadata fallback
+        :return: Duration in seconds
+        """
+        # Use the decoded length so the wakeup deadlines line up with when the
+        # channel actually goes idle; fall back to metadata for duration
+        duration = 0
+        try:
+            duration = sound.get_length()
+        except Exception:
+            pass
+        if duration <= 0:
+            duration = self.audio_manager.get_sound_duration(sound_file) if self.audio_manager else 30
+        return duration
+    
     def _continuous_playback(self):
         """Continuously play sounds from the queue with crossfading"""
-        # Reserve specific channels for playback
-        RESERVED_CHANNELS = 16
+        # The playback loop owns the reserved channels
         channels = [pygame.mixer.Channel(i) for i in range(RESERVED_CHANNELS)]
         channel_index = 0
         
@@ -146,44 +352,67 @@ class SoundPlaybackManager:
         current_sound_end_time = 0
         crossfade_in_progress = False
         
-        # Add a flag to track if we've already logged the empty queue
-        empty_queue_logged = False
+        # Reset the empty queue log flag and any unfinished crossfade for this playback run
+        self._empty_queue_logged = False
+        self._fade_state = None
         
         # Simple crossfade settings
         CROSSFADE_START = 5.0  # Start crossfade 5 seconds before end
         FADE_DURATION = 0.5    # 500ms fade duration
+        FADE_STEP = 0.05       # Volume update interval while fading
+        PREFETCH_AHEAD = 2     # Queued sounds to decode ahead of playback
+        
+        # Wait settings - the thread sleeps until its next deadline instead of polling
+        MIN_WAIT = 0.1   # Re-check interval once a deadline has passed
+        IDLE_WAIT = 1.0  # Upper bound on waiting for an empty queue to fill
         
         while not self._stop_event.is_set():
             try:
+                # Clear before inspecting state so a wakeup during this iteration isn't lost
+                self._wakeup_event.clear()
                 current_time = time.time()
                 
+                # Advance the crossfade, if one is running, to where it should be by now
+                fade = self._fade_state
+                if fade:
+                    progress = min(1.0, max(0.0, (current_time - fade["start"]) / FADE_DURATION))
+                    fade["cur"].set_volume(0.8 * (1 - progress))
+                    fade["nxt"].set_volume(0.8 * progress)
+                    
+                    if progress >= 1.0:
+                        # Fade finished - the incoming sound becomes the current one
+                        fade["cur"].stop()
+                        with self._playback_lock:
+                            if self.playback_queue and self.playback_queue[0] == fade["file"]:
+                                self.playback_queue.popleft()
+                                self._publish_queue()
+                        self._prefetch_upcoming(self._queue_snapshot[:PREFETCH_AHEAD])
+                        
+                        current_channel = fade["nxt"]
+                        current_sound_file = fade["file"]
+                        current_sound_end_time = fade["start"] + fade["duration"]
+                        self._current_channel = current_channel
+                        self._current_sound = current_sound_file
+                        self._current_sound_end_time = current_sound_end_time
+                        crossfade_in_progress = False
+                        self._fade_state = None
+                        playback_logger.info("✅ Crossfade completed for: %s", current_sound_file)
+                    else:
+                        # Come back for the next volume step
+                        self._wakeup_event.wait(FADE_STEP)
+                        continue
+                
                 # CASE 1: Nothing is playing, start a new sound
                 if current_channel is None or not current_channel.get_busy():
                     crossfade_in_progress = False
                     
-                    # Check if there's anything in the queue
-                    with self._playback_lock:
-                        if not self.playback_queue:
-                            # Log when the queue is empty
-                            if not empty_queue_logged:
-                                print("🔄 Queue is now empty")
-                                empty_queue_logged = True
-                                
-                            # Handle empty queue - but don't add to queue if we're in End section
-                            current_section = self._get_current_section_name()
-                            if current_sound_file and current_section != "Final" and not self._performance_ended:
-                                self.playback_queue.append(current_sound_file)
-                            elif current_section == "Final" or self._performance_ended:
-                                continue
-                                # Don't add to queue
-                            time.sleep(0.1)
-                            continue
-                        else:
-                            # Reset the empty queue logged flag when we have items again
-                            empty_queue_logged = False
-                        
-                        # Get next sound from queue
-                        sound_file = self.playback_queue.pop(0)
+                    # Get the next sound from the queue
+                    queue_was_empty, sound_file = self._requeue_and_report(current_sound_file)
+                    
+                    # Nothing to play - wait for something to be queued
+                    if sound_file is None:
+                        self._wakeup_event.wait(IDLE_WAIT)
+                        continue
                     
                     # Update current sound tracking
                     current_sound_file = sound_file
@@ -192,28 +421,23 @@ class SoundPlaybackManager:
                     # Load and play the sound using audio manager
                     sound = self.audio_manager.get_sound(sound_file) if self.audio_manager else None
                     if not sound:
-                        print(f"⚠️ Failed to load sound: {sound_file}")
+                        playback_logger.warning("⚠️ Failed to load sound: %s", sound_file)
+                        self._wakeup_event.wait(MIN_WAIT)
                         continue
                     
-                    # Get metadata for duration from audio manager
-                    duration = 30  # Default duration
+                    duration = self._get_playback_duration(sound, sound_file)
+                    
                     if self.audio_manager:
-                        duration = self.audio_manager.get_sound_duration(sound_file)
-
                         try:
-                            print(f"Attempting to send drone notes SOUND FILE: ${sound_file}")
-                            # Import the necessary functions
-                            from api_client import generate_drone_frequencies, WebAppClient
-                            
+                            playback_logger.debug("Attempting to send drone notes SOUND FILE: $%s", sound_file)
                             # Attempt to send drone notes for the current sound file
                             send_drone_notes(
                                 sound_file, 
                                 self.audio_manager.sound_metadata, 
-                                WebAppClient(), 
-                                generate_drone_frequencies
+                                *self._get_drone_client()
                             )
                         except Exception as e:
-                            print(f"❌ Error in drone note sending: {e}")
+                            playback_logger.error("❌ Error in drone note sending: %s", e)
                     
                     # Set up the channel
                     current_channel = channels[channel_index]
@@ -228,12 +452,16 @@ class SoundPlaybackManager:
                     current_sound_end_time = current_time + duration
                     self._current_sound_end_time = current_sound_end_time
                     
-                    print(f"▶️ +++++ Playing: {sound_file} (duration: {duration:.1f}s)")
+                    playback_logger.info("▶️ +++++ Playing: %s (duration: %.1fs)", sound_file, duration)
+                    
+                    # Print remaining queue from a snapshot
+                    queue_snapshot = self._queue_snapshot
                     
-                    # Print remaining queue
-                    with self._playback_lock:
-                        if self.playback_queue:
-                            print(f"Queue: {', '.join(self.playback_queue)}")
+                    if queue_snapshot:
+                        playback_logger.debug("Queue: %s", queue_snapshot)
+                        
+                        # Decode the next sounds while this one plays
+                        self._prefetch_upcoming(queue_snapshot[:PREFETCH_AHEAD])
                 
                 # CASE 2: Sound is playing, check if we need to start crossfade
                 elif current_channel.get_busy() and not crossfade_in_progress:
@@ -244,39 +472,24 @@ class SoundPlaybackManager:
                         crossfade_in_progress = True
                         
                         # Check if there's a next sound in the queue
-                        with self._playback_lock:
-                            # If queue is empty and we're not stopping, add current sound back for looping
-                            # But don't add if we're in End section
-                            current_section = self._get_current_section_name()
-                            if not self.playback_queue and current_sound_file:
-                                # Log when the queue is empty during crossfade check
-                                if not empty_queue_logged:
-                                    print("🔄 Queue is empty during crossfade check")
-                                    empty_queue_logged = True
-                                
-                                # Only add back to queue if not in Final section
-                                if current_section != "Final" and not self._performance_ended:
-                                    self.playback_queue.append(current_sound_file)
-                                else:
-                                    continue
-                                    # Don't add to queue
-                            else:
-                                # Reset the empty queue logged flag when we have items again
-                                empty_queue_logged = False
-                            
-                            # Still nothing in queue? Skip crossfade
-                            if not self.playback_queue:
-                                crossfade_in_progress = False
+                        queue_was_empty, next_sound_file = self._requeue_and_report(current_sound_file, pop=False)
+                        
+                        if next_sound_file is None:
+                            # Final section - let the current sound finish without looping
+                            if queue_was_empty:
                                 continue
                             
-                            # Get next sound filename
-                            next_sound_file = self.playback_queue[0]
+                            # Still nothing in queue? Skip crossfade
+                            crossfade_in_progress = False
+                            self._wakeup_event.wait(MIN_WAIT)
+                            continue
                         
                         # Load the next sound using audio manager
                         next_sound = self.audio_manager.get_sound(next_sound_file) if self.audio_manager else None
                         if not next_sound:
                             # Failed to load next sound, try again next cycle
                             crossfade_in_progress = False
+                            self._wakeup_event.wait(MIN_WAIT)
                             continue
                         
                         # Choose the next channel
@@ -288,95 +501,70 @@ class SoundPlaybackManager:
                             next_channel.stop()
                         
                         # Start crossfade
+                        next_duration = self._get_playback_duration(next_sound, next_sound_file)
                         next_channel.set_volume(0.0)  # Start silent
                         next_channel.play(next_sound)
-                        print(f"▶️ Playing: {next_sound_file} (duration: {duration:.1f}s)")
+                        playback_logger.info("▶️ Playing: %s (duration: %.1fs)", next_sound_file, next_duration)
+                        playback_logger.info("🔀 Starting crossfade to: %s", next_sound_file)
                         
-                        # Create a separate thread for the fade
-                        threading.Thread(
-                            target=self._perform_crossfade,
-                            args=(current_channel, next_channel, next_sound_file, next_channel_index, FADE_DURATION),
-                            daemon=True
-                        ).start()
+                        # The fade itself is stepped at the top of this loop
+                        self._fade_state = {
+                            "start": current_time,
+                            "cur": current_channel,
+                            "nxt": next_channel,
+                            "file": next_sound_file,
+                            "duration": next_duration,
+                        }
                         
                         # Update channel index for next use
                         channel_index = (next_channel_index + 1) % RESERVED_CHANNELS
                 
-                # Sleep to avoid consuming too much CPU
-                time.sleep(0.1)
+                # A crossfade was just started - begin stepping it right away
+                if self._fade_state:
+                    continue
                 
-            except Exception as e:
-                print(f"Error in playback: {e}")
-                time.sleep(0.5)
-    
-    def _perform_crossfade(self, current_channel, next_channel, next_sound_file, next_channel_index, fade_duration):
-        """Perform crossfade in a separate thread to avoid audio hiccups"""
-        try:
-            print(f"🔀 Starting crossfade to: {next_sound_file}")
-            # Start by making sure the new sound is playing silently
-            # and wait a moment for it to stabilize
-            next_channel.set_volume(0.0)
-            time.sleep(0.05)  # Small buffer time
-            
-            # Define fewer steps for smoother transition
-            steps = 10  # Using fewer, more spaced out steps
-            step_time = fade_duration / steps
-            
-            # Pre-calculate all volume levels to minimize calculations during crossfade
-            fade_out_volumes = [max(0, 0.8 * (1 - (i/steps))) for i in range(steps+1)]
-            fade_in_volumes = [min(0.8, 0.8 * (i/steps)) for i in range(steps+1)]
-            
-            # Execute the crossfade with pre-calculated values
-            for i in range(steps+1):
-                if self._stop_event.is_set():
-                    break
-                    
-                # Set volumes with pre-calculated values
-                current_channel.set_volume(fade_out_volumes[i])
-                next_channel.set_volume(fade_in_volumes[i])
+                # Sleep until the crossfade point (or the end of the sound once fading),
+                # unless the queue changes or playback is stopped first
+                if crossfade_in_progress:
+                    next_deadline = current_sound_end_time
+                else:
+                    next_deadline = current_sound_end_time - CROSSFADE_START
+                self._wakeup_event.wait(max(MIN_WAIT, next_deadline - time.time()))
                 
-                # Use a longer sleep between steps
-                time.sleep(step_time)
-            
-            # Ensure final volumes are correct
-            current_channel.set_volume(0)
-            next_channel.set_volume(0.8)
-            
-            # Update tracking variables and clean up
-            # Rest of the function remains the same...
+            except Exception as e:
+                playback_logger.exception("Error in playback: %s", e)
+                self._stop_event.wait(0.5)
         
-        except Exception as e:
-            print(f"Error during crossfade: {e}")
-        finally:
-            print(f"✅ Crossfade completed for: {next_sound_file}")
+        # Stopped - abandon any crossfade in progress and forget the stopped sound
+        self._fade_state = None
+        self._current_channel = None
+        self._current_sound = None
+        self._current_sound_end_time = 0
     
     def print_channel_status(self):
         """Print status of all audio channels for debugging"""
-        print("\n🔊 CHANNEL STATUS REPORT:")
-        print(f"Total channels: {pygame.mixer.get_num_channels()}")
+        num_channels = pygame.mixer.get_num_channels()
+        
+        # Collect the report and print it in one write
+        lines = ["\n🔊 CHANNEL STATUS REPORT:", f"Total channels: {num_channels}"]
         
         busy_channels = 0
-        for i in range(pygame.mixer.get_num_channels()):
+        for i in range(num_channels):
             channel = pygame.mixer.Channel(i)
-            is_busy = channel.get_busy()
-            volume = channel.get_volume()
-            
-            if is_busy:
+            if channel.get_busy():
                 busy_channels += 1
-                print(f"  Channel {i}: BUSY (vol={volume:.2f})")
+                lines.append(f"  Channel {i}: BUSY (vol={channel.get_volume():.2f})")
         
-        print(f"Busy channels: {busy_channels}/{pygame.mixer.get_num_channels()} ({busy_channels/pygame.mixer.get_num_channels()*100:.1f}%)")
-        print(f"Current sound: {self._current_sound}")
+        lines.append(f"Busy channels: {busy_channels}/{num_channels} ({busy_channels/num_channels*100:.1f}%)")
+        lines.append(f"Current sound: {self._current_sound}")
         
-        # Print remaining time if a sound is playing
+        # Report remaining time if a sound is playing
         if self._current_sound_end_time > 0:
             remaining = self._current_sound_end_time - time.time()
-            print(f"Remaining time: {remaining:.1f}s")
-        
-        # Print queue contents
-        print("Queue contents:")
-        with self._playback_lock:
-            for i, sound in enumerate(self.playback_queue):
-                print(f"  {i+1}. {sound}")
+            lines.append(f"Remaining time: {remaining:.1f}s")
         
-        print("-" * 40)
\ No newline at end of file
+        # Report queue contents
+        lines.append("Queue contents:")
+        lines.extend(f"  {i}. {sound}" for i, sound in enumerate(self._queue_snapshot, 1))
+        lines.append("-" * 40)
+        print("\n".join(lines))
\ No newline at end of file
@@ -54,67 +54,53 @@ def seconds_to_time_str(total_seconds):
     minutes, seconds = divmod(int(total_seconds), 60)
     return f"{minutes:02d}:{seconds:02d}"
 
+# Section time keys: (seconds key, 'MM:SS' key, normalized seconds key)
+SECTION_TIME_KEYS = [
+    ('start_seconds', 'start_time', 'start_time_seconds'),
+    ('end_seconds', 'end_time', 'end_time_seconds'),
+    ('midpoint_seconds', 'midpoint_time', 'midpoint_time_seconds'),
+    ('climax_seconds', 'climax_time', 'climax_time_seconds')
+]
+
 def convert_model_to_seconds(model):
     """
     Convert a performance model to ensure consistent seconds representation.
     
+    Each section gets a *_time_seconds key for start, end, midpoint and climax,
+    taken from the matching *_seconds key or parsed from an 'MM:SS' *_time key.
+    Sections are copied, so the input model is left unchanged.
+    
     Args:
         model (dict): Performance model 
     
     Returns:
         dict: Performance model with consistent seconds keys
     """
-    # Create a deep copy to avoid modifying the original
-    import copy
-    converted_model = copy.deepcopy(model)
-    
-    # Mapping of existing keys to ensure consistency
-    time_key_mapping = [
-        ('start_seconds', 'start_time_seconds'),
-        ('end_seconds', 'end_time_seconds'),
-        ('midpoint_seconds', 'midpoint_time_seconds'),
-        ('climax_seconds', 'climax_time_seconds')
-    ]
+    converted_model = dict(model)
     
-    # Convert section times
-    for section in converted_model.get('sections', []):
-        for old_key, new_key in time_key_mapping:
-            # If the old key exists, create the new key with the same value
-            if old_key in section:
-                section[new_key] = section[old_key]
-            
-            # Ensure the new key exists even if the old one doesn't
-            if new_key not in section:
-                section[new_key] = section.get(old_key, 0)
-        
-        # Debug print to verify keys
-        print(f"Section {section.get('section_name', 'Unknown')}: {list(section.keys())}")
+    # Convert total duration if it's a string
+    if isinstance(model.get('total_duration'), str):
+        converted_model['total_duration_seconds'] = time_to_seconds(model['total_duration'])
+    
+    # Convert section times in one pass
+    converted_model['sections'] = [
+        _convert_section_to_seconds(section) for section in model.get('sections', [])
+    ]
     
     return converted_model
 
-    def _get_sound_duration(self, sound_file):
-        """
-        Get the duration of a sound file in seconds
-        
-        :param sound_file: Name of the sound file
-        :return: Duration in seconds or default value of 30 seconds if unknown
-        """
-        # First check metadata from sound_files
-        metadata = self.sound_files.get(sound_file, {})
-        if 'duration_seconds' in metadata:
-            return metadata.get('duration_seconds')
-        
-        # If not in metadata, try to get it from the sound object
-        sound = self._load_sound(sound_file)
-        if sound:
-            try:
-                return sound.get_length()
-            except:
-                pass
-        
-        # Default duration if we can't determine it
-        print(f"⚠️ Could not determine duration for {sound_file}, using default (30s)")
-        return 30.0
+def _convert_section_to_seconds(section):
+    """Copy a section, adding the normalized *_time_seconds keys"""
+    converted = dict(section)
+    for seconds_key, time_key, new_key in SECTION_TIME_KEYS:
+        if seconds_key in section:
+            converted[new_key] = section[seconds_key]
+        elif new_key not in section:
+            converted[new_key] = time_to_seconds(section.get(time_key))
+    
+    # Debug print to verify keys
+    print(f"Section {converted.get('section_name', 'Unknown')}: {list(converted.keys())}")
+    return converted
 
 # Optional: If you want to include some basic testing
 if __name__ == "__main__":